@@ -720,6 +720,8 @@ def get_kinetics_info(template_key: str) -> Optional[KineticsInfo]:
 _INDEX_PATTERN = re.compile(
     r"\b(C|B|subsR|bioR)\s*\[\s*(\d+)\s*\]"
 )
+_BLOCK_COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.DOTALL)
+_LINE_COMMENT_PATTERN = re.compile(r"//[^\n]*")
 
 # Expected C++ function signatures (name only - parameter styles vary)
 _BIOTIC_FUNC_NAME = "defineRxnKinetics"
@@ -759,9 +761,9 @@ def verify_function_signature(source: str, kind: str) -> List[str]:
         return errors  # empty source checked elsewhere
 
     # Strip block comments  /* ... */
-    stripped = re.sub(r"/\*.*?\*/", "", source, flags=re.DOTALL)
+    stripped = _BLOCK_COMMENT_PATTERN.sub("", source)
     # Strip line comments
-    stripped = re.sub(r"//[^\n]*", "", stripped)
+    stripped = _LINE_COMMENT_PATTERN.sub("", stripped)
 
     if kind == "biotic":
         fname = _BIOTIC_FUNC_NAME
@@ -5,12 +5,28 @@ complab_functions.hh::initialize_complab().
 """
 
 import json
+import math
 import os
 import datetime
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from io import StringIO
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.sax.saxutils import XMLGenerator
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from lxml import etree as lxml_etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 from .project import (
     CompLaBProject, PathSettings, SimulationMode, DomainSettings,
@@ -19,6 +35,14 @@ from .project import (
 )
 
 
+# Index with bool(x): hand-edited .complab files may hold 0/1 or null
+_BOOL_STR = {True: "true", False: "false"}
+_BOOL_MAP = {
+    "true": True, "yes": True, "1": True, "biotic": True,
+    "false": False, "no": False, "0": False, "abiotic": False,
+}
+
+
 class ProjectManager:
     """Handles project file I/O: .complab (JSON) and CompLaB.xml."""
 
@@ -26,18 +50,41 @@ class ProjectManager:
 
     @staticmethod
     def save_project(project: CompLaBProject, filepath: str) -> None:
-        data = _project_to_dict(project)
-        data["_meta"] = {
-            "version": "2.1",
-            "saved": datetime.datetime.now().isoformat(),
-        }
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        # Keep indent=2 so .complab files stay hand-editable.  orjson
+        # writes NaN/inf as null, so such projects take the stdlib path,
+        # which keeps them as NaN/Infinity.
+        payload = None
+        if HAS_ORJSON and _all_finite(project):
+            # orjson walks the nested dataclasses natively, so only the top
+            # level is spread into a dict (to append "_meta").
+            data = {f.name: getattr(project, f.name) for f in fields(project)}
+            data["_meta"] = _save_meta()
+            try:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            except orjson.JSONEncodeError:
+                # Values json accepts but orjson rejects, e.g. float
+                # subclasses such as numpy.float64 or ints over 64 bits
+                payload = None
+        if payload is None:
+            data = _project_to_dict(project)
+            data["_meta"] = _save_meta()
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        # Only open (and truncate) the file once serialization succeeded
+        with open(filepath, "wb") as f:
+            f.write(payload)
 
     @staticmethod
     def load_project(filepath: str) -> CompLaBProject:
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            raw = f.read()
+        if HAS_ORJSON:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # orjson rejects the NaN/Infinity tokens json.dump writes
+                data = json.loads(raw)
+        else:
+            data = json.loads(raw)
         data.pop("_meta", None)
         return _dict_to_project(data)
 
@@ -65,357 +112,327 @@ class ProjectManager:
 
     @staticmethod
     def export_xml(project: CompLaBProject, filepath: str) -> None:
-        root = ET.Element("parameters")
-
-        # <path>
-        path_el = ET.SubElement(root, "path")
-        _add_text(path_el, "src_path", project.path_settings.src_path)
-        _add_text(path_el, "input_path", project.path_settings.input_path)
-        _add_text(path_el, "output_path", project.path_settings.output_path)
-
-        # <simulation_mode>
-        sm = project.simulation_mode
-        sm_el = ET.SubElement(root, "simulation_mode")
-        _add_text(sm_el, "biotic_mode", _bool_str(sm.biotic_mode))
-        _add_text(sm_el, "enable_kinetics", _bool_str(sm.enable_kinetics))
-        _add_text(sm_el, "enable_abiotic_kinetics",
-                  _bool_str(sm.enable_abiotic_kinetics))
-        _add_text(sm_el, "enable_validation_diagnostics",
-                  _bool_str(sm.enable_validation_diagnostics))
-
-        # <LB_numerics>
-        lb = ET.SubElement(root, "LB_numerics")
-        dom_el = ET.SubElement(lb, "domain")
-        d = project.domain
-        _add_text(dom_el, "nx", str(d.nx))
-        _add_text(dom_el, "ny", str(d.ny))
-        _add_text(dom_el, "nz", str(d.nz))
-        _add_text(dom_el, "dx", _fmt_float(d.dx))
-        if d.dy > 0 and d.dy != d.dx:
-            _add_text(dom_el, "dy", _fmt_float(d.dy))
-        if d.dz > 0 and d.dz != d.dx:
-            _add_text(dom_el, "dz", _fmt_float(d.dz))
-        _add_text(dom_el, "unit", d.unit)
-        _add_text(dom_el, "characteristic_length", _fmt_float(d.characteristic_length))
-        _add_text(dom_el, "filename", d.geometry_filename)
-
-        mat_el = ET.SubElement(dom_el, "material_numbers")
-        _add_text(mat_el, "pore", d.pore)
-        _add_text(mat_el, "solid", d.solid)
-        _add_text(mat_el, "bounce_back", d.bounce_back)
-        # Per-microbe material numbers (only sessile/CA microbes)
-        for i, mic in enumerate(project.microbiology.microbes):
-            if mic.material_number.strip():
-                _add_text(mat_el, f"microbe{i}", mic.material_number)
-
-        fl = project.fluid
-        _add_text(lb, "delta_P", _fmt_float(fl.delta_P))
-        _add_text(lb, "Peclet", _fmt_float(fl.peclet))
-        _add_text(lb, "tau", _fmt_float(fl.tau))
-        _add_text(lb, "track_performance", _bool_str(fl.track_performance))
-
-        it_el = ET.SubElement(lb, "iteration")
-        it = project.iteration
-        _add_text(it_el, "ns_max_iT1", str(it.ns_max_iT1))
-        _add_text(it_el, "ns_max_iT2", str(it.ns_max_iT2))
-        _add_text(it_el, "ns_converge_iT1", _fmt_float(it.ns_converge_iT1))
-        _add_text(it_el, "ns_converge_iT2", _fmt_float(it.ns_converge_iT2))
-        _add_text(it_el, "ade_max_iT", str(it.ade_max_iT))
-        _add_text(it_el, "ade_converge_iT", _fmt_float(it.ade_converge_iT))
-        if it.ns_rerun_iT0 > 0:
-            _add_text(it_el, "ns_rerun_iT0", str(it.ns_rerun_iT0))
-        if it.ade_rerun_iT0 > 0:
-            _add_text(it_el, "ade_rerun_iT0", str(it.ade_rerun_iT0))
-        _add_text(it_el, "ns_update_interval", str(it.ns_update_interval))
-        _add_text(it_el, "ade_update_interval", str(it.ade_update_interval))
-
-        # <chemistry>
-        chem_el = ET.SubElement(root, "chemistry")
-        subs = project.substrates
-        _add_text(chem_el, "number_of_substrates", str(len(subs)))
-        for i, s in enumerate(subs):
-            s_el = ET.SubElement(chem_el, f"substrate{i}")
-            _add_text(s_el, "name_of_substrates", s.name)
-            _add_text(s_el, "initial_concentration", _fmt_float(s.initial_concentration))
-            diff_el = ET.SubElement(s_el, "substrate_diffusion_coefficients")
-            _add_text(diff_el, "in_pore", _fmt_float(s.diffusion_in_pore))
-            _add_text(diff_el, "in_biofilm", _fmt_float(s.diffusion_in_biofilm))
-            _add_text(s_el, "left_boundary_type", s.left_boundary_type)
-            _add_text(s_el, "right_boundary_type", s.right_boundary_type)
-            _add_text(s_el, "left_boundary_condition", _fmt_float(s.left_boundary_condition))
-            _add_text(s_el, "right_boundary_condition", _fmt_float(s.right_boundary_condition))
-
-        # <microbiology>
-        mb = project.microbiology
-        mb_el = ET.SubElement(root, "microbiology")
-        microbes = mb.microbes
-        _add_text(mb_el, "number_of_microbes", str(len(microbes)))
-        _add_text(mb_el, "maximum_biomass_density", _fmt_float(mb.maximum_biomass_density))
-        _add_text(mb_el, "thrd_biofilm_fraction", _fmt_float(mb.thrd_biofilm_fraction))
-        _add_text(mb_el, "CA_method", mb.ca_method)
-        for i, m in enumerate(microbes):
-            m_el = ET.SubElement(mb_el, f"microbe{i}")
-            _add_text(m_el, "name_of_microbes", m.name)
-            _add_text(m_el, "solver_type", m.solver_type)
-            _add_text(m_el, "reaction_type", m.reaction_type)
-            _add_text(m_el, "initial_densities", m.initial_densities)
-            _add_text(m_el, "decay_coefficient", _fmt_float(m.decay_coefficient))
-            _add_text(m_el, "viscosity_ratio_in_biofilm",
-                      _fmt_float(m.viscosity_ratio_in_biofilm))
-            if m.half_saturation_constants.strip():
-                _add_text(m_el, "half_saturation_constants", m.half_saturation_constants)
-            if m.maximum_uptake_flux.strip():
-                _add_text(m_el, "maximum_uptake_flux", m.maximum_uptake_flux)
-            _add_text(m_el, "left_boundary_type", m.left_boundary_type)
-            _add_text(m_el, "right_boundary_type", m.right_boundary_type)
-            _add_text(m_el, "left_boundary_condition",
-                      _fmt_float(m.left_boundary_condition))
-            _add_text(m_el, "right_boundary_condition",
-                      _fmt_float(m.right_boundary_condition))
-            bd_el = ET.SubElement(m_el, "biomass_diffusion_coefficients")
-            _add_text(bd_el, "in_pore", _fmt_float(m.biomass_diffusion_in_pore))
-            _add_text(bd_el, "in_biofilm", _fmt_float(m.biomass_diffusion_in_biofilm))
-
-        # <equilibrium>
-        eq = project.equilibrium
-        eq_el = ET.SubElement(root, "equilibrium")
-        _add_text(eq_el, "enabled", _bool_str(eq.enabled))
-        if eq.enabled and eq.component_names:
-            _add_text(eq_el, "components", " ".join(eq.component_names))
-            # Solver parameters (read by C++ solver from XML)
-            _add_text(eq_el, "max_iterations", str(eq.max_iterations))
-            _add_text(eq_el, "tolerance", _fmt_float(eq.tolerance))
-            _add_text(eq_el, "anderson_depth", str(eq.anderson_depth))
-            _add_text(eq_el, "beta", _fmt_float(eq.beta))
-            # stoichiometry
-            st_el = ET.SubElement(eq_el, "stoichiometry")
-            for i, row in enumerate(eq.stoichiometry):
-                _add_text(st_el, f"species{i}", " ".join(_fmt_float(v) for v in row))
-            # logK
-            lk_el = ET.SubElement(eq_el, "logK")
-            for i, val in enumerate(eq.log_k):
-                _add_text(lk_el, f"species{i}", _fmt_float(val))
-
-        # <IO>
-        io = project.io_settings
-        io_el = ET.SubElement(root, "IO")
-        _add_text(io_el, "read_NS_file", _bool_str(io.read_ns_file))
-        _add_text(io_el, "read_ADE_file", _bool_str(io.read_ade_file))
-        _add_text(io_el, "ns_filename", io.ns_filename)
-        _add_text(io_el, "mask_filename", io.mask_filename)
-        _add_text(io_el, "subs_filename", io.subs_filename)
-        _add_text(io_el, "bio_filename", io.bio_filename)
-        _add_text(io_el, "save_VTK_interval", str(io.save_vtk_interval))
-        _add_text(io_el, "save_CHK_interval", str(io.save_chk_interval))
-
-        # Pretty-print
-        rough = ET.tostring(root, encoding="unicode")
-        parsed = minidom.parseString(rough)
-        pretty = parsed.toprettyxml(indent="    ", encoding=None)
-        # Remove extra XML declaration minidom adds
-        lines = pretty.split("\n")
-        if lines and lines[0].startswith("<?xml"):
-            lines[0] = '<?xml version="1.0" ?>'
-        with open(filepath, "w") as f:
-            f.write("\n".join(lines))
+        # Every field is written exactly once in a fixed order, so the
+        # document is streamed into a string instead of built as a tree.
+        # The file is only opened (and truncated) once that has succeeded,
+        # and then written in one call.
+        with StringIO() as f:
+            f.write('<?xml version="1.0" ?>\n')
+            w = _XMLWriter(f)
+            w.start("parameters")
+
+            # <path>
+            ps = project.path_settings
+            w.start("path")
+            w.texts((
+                ("src_path", ps.src_path),
+                ("input_path", ps.input_path),
+                ("output_path", ps.output_path),
+            ))
+            w.end()
+
+            # <simulation_mode>
+            sm = project.simulation_mode
+            w.start("simulation_mode")
+            w.texts((
+                ("biotic_mode", _BOOL_STR[bool(sm.biotic_mode)]),
+                ("enable_kinetics", _BOOL_STR[bool(sm.enable_kinetics)]),
+                ("enable_abiotic_kinetics",
+                 _BOOL_STR[bool(sm.enable_abiotic_kinetics)]),
+                ("enable_validation_diagnostics",
+                 _BOOL_STR[bool(sm.enable_validation_diagnostics)]),
+            ))
+            w.end()
+
+            # <LB_numerics>
+            w.start("LB_numerics")
+            w.start("domain")
+            d = project.domain
+            w.texts((
+                ("nx", str(d.nx)),
+                ("ny", str(d.ny)),
+                ("nz", str(d.nz)),
+                ("dx", _fmt_float(d.dx)),
+            ))
+            if d.dy > 0 and d.dy != d.dx:
+                w.text("dy", _fmt_float(d.dy))
+            if d.dz > 0 and d.dz != d.dx:
+                w.text("dz", _fmt_float(d.dz))
+            w.texts((
+                ("unit", d.unit),
+                ("characteristic_length", _fmt_float(d.characteristic_length)),
+                ("filename", d.geometry_filename),
+            ))
+
+            w.start("material_numbers")
+            w.texts((
+                ("pore", d.pore),
+                ("solid", d.solid),
+                ("bounce_back", d.bounce_back),
+            ))
+            # Per-microbe material numbers (only sessile/CA microbes)
+            for i, mic in enumerate(project.microbiology.microbes):
+                if mic.material_number.strip():
+                    w.text(f"microbe{i}", mic.material_number)
+            w.end()  # material_numbers
+            w.end()  # domain
+
+            fl = project.fluid
+            w.texts((
+                ("delta_P", _fmt_float(fl.delta_P)),
+                ("Peclet", _fmt_float(fl.peclet)),
+                ("tau", _fmt_float(fl.tau)),
+                ("track_performance", _BOOL_STR[bool(fl.track_performance)]),
+            ))
+
+            w.start("iteration")
+            it = project.iteration
+            w.texts((
+                ("ns_max_iT1", str(it.ns_max_iT1)),
+                ("ns_max_iT2", str(it.ns_max_iT2)),
+                ("ns_converge_iT1", _fmt_float(it.ns_converge_iT1)),
+                ("ns_converge_iT2", _fmt_float(it.ns_converge_iT2)),
+                ("ade_max_iT", str(it.ade_max_iT)),
+                ("ade_converge_iT", _fmt_float(it.ade_converge_iT)),
+            ))
+            if it.ns_rerun_iT0 > 0:
+                w.text("ns_rerun_iT0", str(it.ns_rerun_iT0))
+            if it.ade_rerun_iT0 > 0:
+                w.text("ade_rerun_iT0", str(it.ade_rerun_iT0))
+            w.texts((
+                ("ns_update_interval", str(it.ns_update_interval)),
+                ("ade_update_interval", str(it.ade_update_interval)),
+            ))
+            w.end()  # iteration
+            w.end()  # LB_numerics
+
+            # <chemistry>
+            w.start("chemistry")
+            subs = project.substrates
+            w.text("number_of_substrates", str(len(subs)))
+            for i, s in enumerate(subs):
+                w.start(f"substrate{i}")
+                w.texts((
+                    ("name_of_substrates", s.name),
+                    ("initial_concentration",
+                     _fmt_float(s.initial_concentration)),
+                ))
+                w.start("substrate_diffusion_coefficients")
+                w.texts((
+                    ("in_pore", _fmt_float(s.diffusion_in_pore)),
+                    ("in_biofilm", _fmt_float(s.diffusion_in_biofilm)),
+                ))
+                w.end()
+                w.texts((
+                    ("left_boundary_type", s.left_boundary_type),
+                    ("right_boundary_type", s.right_boundary_type),
+                    ("left_boundary_condition",
+                     _fmt_float(s.left_boundary_condition)),
+                    ("right_boundary_condition",
+                     _fmt_float(s.right_boundary_condition)),
+                ))
+                w.end()
+            w.end()
+
+            # <microbiology>
+            mb = project.microbiology
+            w.start("microbiology")
+            microbes = mb.microbes
+            w.texts((
+                ("number_of_microbes", str(len(microbes))),
+                ("maximum_biomass_density",
+                 _fmt_float(mb.maximum_biomass_density)),
+                ("thrd_biofilm_fraction", _fmt_float(mb.thrd_biofilm_fraction)),
+                ("CA_method", mb.ca_method),
+            ))
+            for i, m in enumerate(microbes):
+                w.start(f"microbe{i}")
+                w.texts((
+                    ("name_of_microbes", m.name),
+                    ("solver_type", m.solver_type),
+                    ("reaction_type", m.reaction_type),
+                    ("initial_densities", m.initial_densities),
+                    ("decay_coefficient", _fmt_float(m.decay_coefficient)),
+                    ("viscosity_ratio_in_biofilm",
+                     _fmt_float(m.viscosity_ratio_in_biofilm)),
+                ))
+                if m.half_saturation_constants.strip():
+                    w.text("half_saturation_constants", m.half_saturation_constants)
+                if m.maximum_uptake_flux.strip():
+                    w.text("maximum_uptake_flux", m.maximum_uptake_flux)
+                w.texts((
+                    ("left_boundary_type", m.left_boundary_type),
+                    ("right_boundary_type", m.right_boundary_type),
+                    ("left_boundary_condition",
+                     _fmt_float(m.left_boundary_condition)),
+                    ("right_boundary_condition",
+                     _fmt_float(m.right_boundary_condition)),
+                ))
+                w.start("biomass_diffusion_coefficients")
+                w.texts((
+                    ("in_pore", _fmt_float(m.biomass_diffusion_in_pore)),
+                    ("in_biofilm", _fmt_float(m.biomass_diffusion_in_biofilm)),
+                ))
+                w.end()
+                w.end()
+            w.end()
+
+            # <equilibrium>
+            eq = project.equilibrium
+            w.start("equilibrium")
+            w.text("enabled", _BOOL_STR[bool(eq.enabled)])
+            if eq.enabled and eq.component_names:
+                w.text("components", " ".join(eq.component_names))
+                # Solver parameters (read by C++ solver from XML)
+                w.texts((
+                    ("max_iterations", str(eq.max_iterations)),
+                    ("tolerance", _fmt_float(eq.tolerance)),
+                    ("anderson_depth", str(eq.anderson_depth)),
+                    ("beta", _fmt_float(eq.beta)),
+                ))
+                # stoichiometry (map skips the per-value generator frame)
+                w.start("stoichiometry")
+                w.texts((f"species{i}", " ".join(map(_fmt_float, row)))
+                        for i, row in enumerate(eq.stoichiometry))
+                w.end()
+                # logK
+                w.start("logK")
+                w.texts((f"species{i}", _fmt_float(val))
+                        for i, val in enumerate(eq.log_k))
+                w.end()
+            w.end()
+
+            # <IO>
+            io = project.io_settings
+            w.start("IO")
+            w.texts((
+                ("read_NS_file", _BOOL_STR[bool(io.read_ns_file)]),
+                ("read_ADE_file", _BOOL_STR[bool(io.read_ade_file)]),
+                ("ns_filename", io.ns_filename),
+                ("mask_filename", io.mask_filename),
+                ("subs_filename", io.subs_filename),
+                ("bio_filename", io.bio_filename),
+                ("save_VTK_interval", str(io.save_vtk_interval)),
+                ("save_CHK_interval", str(io.save_chk_interval)),
+            ))
+            w.end()
+
+            w.end()  # parameters
+            f.write("\n")
+            data = f.getvalue().encode("utf-8")
+
+        with open(filepath, "wb") as f:
+            f.write(data)
 
     # ── XML import ──────────────────────────────────────────────────────
 
     @staticmethod
     def import_xml(filepath: str) -> CompLaBProject:
-        tree = ET.parse(filepath)
-        root = tree.getroot()
         proj = CompLaBProject()
         proj.name = Path(filepath).stem
 
-        # <path>
-        p = root.find("path")
-        if p is not None:
-            proj.path_settings.src_path = _get(p, "src_path", "src")
-            proj.path_settings.input_path = _get(p, "input_path", "input")
-            proj.path_settings.output_path = _get(p, "output_path", "output")
-
-        # <simulation_mode>
-        sm_el = root.find("simulation_mode")
-        if sm_el is not None:
-            proj.simulation_mode.biotic_mode = _get_bool(sm_el, "biotic_mode", True)
-            proj.simulation_mode.enable_kinetics = _get_bool(sm_el, "enable_kinetics", True)
-            proj.simulation_mode.enable_abiotic_kinetics = _get_bool(
-                sm_el, "enable_abiotic_kinetics", False)
-            proj.simulation_mode.enable_validation_diagnostics = _get_bool(
-                sm_el, "enable_validation_diagnostics", False)
-
-        # <LB_numerics>
-        lb = root.find("LB_numerics")
-        if lb is not None:
-            dom = lb.find("domain")
-            if dom is not None:
-                proj.domain.nx = _get_int(dom, "nx", 50)
-                proj.domain.ny = _get_int(dom, "ny", 30)
-                proj.domain.nz = _get_int(dom, "nz", 30)
-                proj.domain.dx = _get_float(dom, "dx", 1.0)
-                proj.domain.dy = _get_float(dom, "dy", 0.0)
-                proj.domain.dz = _get_float(dom, "dz", 0.0)
-                proj.domain.unit = _get(dom, "unit", "um")
-                proj.domain.characteristic_length = _get_float(
-                    dom, "characteristic_length", 30.0)
-                proj.domain.geometry_filename = _get(dom, "filename", "geometry.dat")
-                mat = dom.find("material_numbers")
-                if mat is not None:
-                    proj.domain.pore = _get(mat, "pore", "2")
-                    proj.domain.solid = _get(mat, "solid", "0")
-                    proj.domain.bounce_back = _get(mat, "bounce_back", "1")
-
-            proj.fluid.delta_P = _get_float(lb, "delta_P", 0.0)
-            proj.fluid.peclet = _get_float(lb, "Peclet", 0.0)
-            proj.fluid.tau = _get_float(lb, "tau", 0.8)
-            proj.fluid.track_performance = _get_bool(lb, "track_performance", False)
-
-            it = lb.find("iteration")
-            if it is not None:
-                proj.iteration.ns_max_iT1 = _get_int(it, "ns_max_iT1", 100000)
-                proj.iteration.ns_max_iT2 = _get_int(it, "ns_max_iT2", 100000)
-                proj.iteration.ns_converge_iT1 = _get_float(it, "ns_converge_iT1", 1e-8)
-                proj.iteration.ns_converge_iT2 = _get_float(it, "ns_converge_iT2", 1e-6)
-                proj.iteration.ade_max_iT = _get_int(it, "ade_max_iT", 10000000)
-                proj.iteration.ade_converge_iT = _get_float(it, "ade_converge_iT", 1e-8)
-                proj.iteration.ns_rerun_iT0 = _get_int(it, "ns_rerun_iT0", 0)
-                proj.iteration.ade_rerun_iT0 = _get_int(it, "ade_rerun_iT0", 0)
-                proj.iteration.ns_update_interval = _get_int(it, "ns_update_interval", 1)
-                proj.iteration.ade_update_interval = _get_int(it, "ade_update_interval", 1)
-
-        # <chemistry>
-        chem = root.find("chemistry")
-        if chem is not None:
-            n_subs = _get_int(chem, "number_of_substrates", 0)
-            for i in range(n_subs):
-                s_el = chem.find(f"substrate{i}")
-                if s_el is None:
-                    continue
-                sub = Substrate()
-                sub.name = _get(s_el, "name_of_substrates", f"substrate_{i}")
-                sub.initial_concentration = _get_float(s_el, "initial_concentration", 0.0)
-                diff = s_el.find("substrate_diffusion_coefficients")
-                if diff is not None:
-                    sub.diffusion_in_pore = _get_float(diff, "in_pore", 1e-9)
-                    sub.diffusion_in_biofilm = _get_float(diff, "in_biofilm", 2e-10)
-                sub.left_boundary_type = _get(s_el, "left_boundary_type", "Dirichlet")
-                sub.right_boundary_type = _get(s_el, "right_boundary_type", "Neumann")
-                sub.left_boundary_condition = _get_float(s_el, "left_boundary_condition", 0.0)
-                sub.right_boundary_condition = _get_float(s_el, "right_boundary_condition", 0.0)
-                proj.substrates.append(sub)
-
-        # <microbiology>
-        mb_el = root.find("microbiology")
-        if mb_el is not None:
-            proj.microbiology.maximum_biomass_density = _get_float(
-                mb_el, "maximum_biomass_density", 100.0)
-            proj.microbiology.thrd_biofilm_fraction = _get_float(
-                mb_el, "thrd_biofilm_fraction", 0.1)
-            proj.microbiology.ca_method = _get(mb_el, "CA_method", "fraction")
-            n_mic = _get_int(mb_el, "number_of_microbes", 0)
-
-            # Read material numbers from domain section
-            mat_el = None
-            if lb is not None:
-                dom = lb.find("domain")
-                if dom is not None:
-                    mat_el = dom.find("material_numbers")
-
-            for i in range(n_mic):
-                m_el = mb_el.find(f"microbe{i}")
-                if m_el is None:
+        # Stream the file and handle each top-level section as soon as its
+        # end tag is read, then free it, so only one section is in memory.
+        depth = 0
+        results = {}
+        eq_el = None
+        for event, el in _iterparse(filepath):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            tag = el.tag
+            if tag == "equilibrium":
+                # Needs the substrate count; read once all sections are in.
+                # Like find(), only the first copy of a section counts.
+                if eq_el is None:
+                    eq_el = el
                     continue
-                mic = Microbe()
-                mic.name = _get(m_el, "name_of_microbes", f"microbe_{i}")
-                mic.solver_type = _get(m_el, "solver_type", "CA").upper()
-                if mic.solver_type in ("CELLULAR AUTOMATA", "CELLULAR_AUTOMATA"):
-                    mic.solver_type = "CA"
-                elif mic.solver_type in ("LATTICE BOLTZMANN", "LB"):
-                    mic.solver_type = "LBM"
-                elif mic.solver_type in ("FINITE DIFFERENCE", "FINITE_DIFFERENCE"):
-                    mic.solver_type = "FD"
-                mic.reaction_type = _get(m_el, "reaction_type", "kinetics").lower()
-                mic.initial_densities = _get(m_el, "initial_densities", "99.0")
-                mic.decay_coefficient = _get_float(m_el, "decay_coefficient", 0.0)
-                mic.viscosity_ratio_in_biofilm = _get_float(
-                    m_el, "viscosity_ratio_in_biofilm", 10.0)
-                mic.half_saturation_constants = _get(m_el, "half_saturation_constants", "")
-                mic.maximum_uptake_flux = _get(m_el, "maximum_uptake_flux", "")
-                mic.left_boundary_type = _get(m_el, "left_boundary_type", "Neumann")
-                mic.right_boundary_type = _get(m_el, "right_boundary_type", "Neumann")
-                mic.left_boundary_condition = _get_float(
-                    m_el, "left_boundary_condition", 0.0)
-                mic.right_boundary_condition = _get_float(
-                    m_el, "right_boundary_condition", 0.0)
-                bd = m_el.find("biomass_diffusion_coefficients")
-                if bd is not None:
-                    mic.biomass_diffusion_in_pore = _get_float(bd, "in_pore", -99.0)
-                    mic.biomass_diffusion_in_biofilm = _get_float(bd, "in_biofilm", -99.0)
-                # material number from domain section (only sessile microbes have this)
-                if mat_el is not None:
-                    mic.material_number = _get(mat_el, f"microbe{i}", "")
-                proj.microbiology.microbes.append(mic)
-
-        # <equilibrium>
-        eq_el = root.find("equilibrium")
+            else:
+                reader = _SECTION_READERS.get(tag)
+                if reader is not None and tag not in results:
+                    results[tag] = reader(proj, el)
+            el.clear()
+
+        # material number from domain section (only sessile microbes have this)
+        mat_txt = results.get("LB_numerics") or {}
+        for i, mic in results.get("microbiology", ()):
+            mic.material_number = _get(mat_txt, f"microbe{i}", "")
         if eq_el is not None:
-            proj.equilibrium.enabled = _get_bool(eq_el, "enabled", False)
-            comp_text = _get(eq_el, "components", "")
-            if comp_text:
-                proj.equilibrium.component_names = comp_text.split()
-            # Solver parameters
-            proj.equilibrium.max_iterations = _get_int(eq_el, "max_iterations", 200)
-            proj.equilibrium.tolerance = _get_float(eq_el, "tolerance", 1e-10)
-            proj.equilibrium.anderson_depth = _get_int(eq_el, "anderson_depth", 4)
-            proj.equilibrium.beta = _get_float(eq_el, "beta", 1.0)
-            st_el = eq_el.find("stoichiometry")
-            if st_el is not None:
-                n_subs = len(proj.substrates)
-                for i in range(n_subs):
-                    sp = st_el.find(f"species{i}")
-                    if sp is not None and sp.text:
-                        row = [float(x) for x in sp.text.strip().split()]
-                    else:
-                        row = [0.0] * len(proj.equilibrium.component_names)
-                    proj.equilibrium.stoichiometry.append(row)
-            lk_el = eq_el.find("logK")
-            if lk_el is not None:
-                n_subs = len(proj.substrates)
-                for i in range(n_subs):
-                    sp = lk_el.find(f"species{i}")
-                    if sp is not None and sp.text:
-                        proj.equilibrium.log_k.append(float(sp.text.strip()))
-                    else:
-                        proj.equilibrium.log_k.append(0.0)
-
-        # <IO>
-        io_el = root.find("IO")
-        if io_el is not None:
-            proj.io_settings.read_ns_file = _get_bool(io_el, "read_NS_file", False)
-            proj.io_settings.read_ade_file = _get_bool(io_el, "read_ADE_file", False)
-            proj.io_settings.ns_filename = _get(io_el, "ns_filename", "nsLattice")
-            proj.io_settings.mask_filename = _get(io_el, "mask_filename", "maskLattice")
-            proj.io_settings.subs_filename = _get(io_el, "subs_filename", "subsLattice")
-            proj.io_settings.bio_filename = _get(io_el, "bio_filename", "bioLattice")
-            proj.io_settings.save_vtk_interval = _get_int(io_el, "save_VTK_interval", 1000)
-            proj.io_settings.save_chk_interval = _get_int(io_el, "save_CHK_interval", 1000000)
+            _read_equilibrium(proj, eq_el)
 
         return proj
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────
 
-def _add_text(parent: ET.Element, tag: str, text: str) -> ET.Element:
-    el = ET.SubElement(parent, tag)
-    el.text = text
-    return el
-
-
-def _bool_str(val: bool) -> str:
-    return "true" if val else "false"
-
-
+class _XMLWriter:
+    """Streams indented XML elements to a text file via XMLGenerator.
+
+    Peak memory is bounded by the nesting depth rather than the document.
+    Elements without children are written self-closing, like minidom did.
+    """
+
+    def __init__(self, out, indent: str = "    "):
+        self._gen = XMLGenerator(out, short_empty_elements=True)
+        self._indent = indent
+        # One [tag, has_children] entry per open element
+        self._stack = []
+
+    def _newline(self) -> None:
+        if self._stack:
+            self._stack[-1][1] = True
+            self._gen.ignorableWhitespace(
+                "\n" + self._indent * len(self._stack))
+
+    def start(self, tag: str) -> None:
+        self._newline()
+        self._gen.startElement(tag, {})
+        self._stack.append([tag, False])
+
+    def end(self) -> None:
+        tag, has_children = self._stack.pop()
+        if has_children:
+            self._gen.ignorableWhitespace(
+                "\n" + self._indent * len(self._stack))
+        self._gen.endElement(tag)
+
+    def text(self, tag: str, text: str) -> None:
+        self._newline()
+        self._gen.startElement(tag, {})
+        self._gen.characters(text)
+        self._gen.endElement(tag)
+
+    def texts(self, pairs) -> None:
+        """Write a run of (tag, text) leaves into the open element.
+
+        *pairs* may be any iterable; an empty one leaves the element
+        self-closing.
+        """
+        pad = "\n" + self._indent * len(self._stack)
+        gen = self._gen
+        whitespace, start = gen.ignorableWhitespace, gen.startElement
+        characters, end = gen.characters, gen.endElement
+        no_attrs = {}
+        tag = None
+        for tag, text in pairs:
+            whitespace(pad)
+            start(tag, no_attrs)
+            characters(text)
+            end(tag)
+        if tag is not None:
+            self._stack[-1][1] = True
+
+
+def _parse_row(text: str) -> List[float]:
+    """Parse a whitespace-separated row of numbers (split() drops padding)."""
+    return list(map(float, text.split()))
+
+
+# Cached: defaults, boundary values and stoichiometry zeros repeat a lot
+@lru_cache(maxsize=2048)
 def _fmt_float(val: float) -> str:
     if val == 0.0:
         return "0.0"
@@ -426,40 +443,304 @@ def _fmt_float(val: float) -> str:
     return s
 
 
-def _get(el: ET.Element, tag: str, default: str) -> str:
-    child = el.find(tag)
-    if child is not None and child.text:
-        return child.text.strip()
+def _iterparse(filepath: str):
+    """Start/end events for *filepath*, parsed by libxml2 when lxml is there.
+
+    Comments and processing instructions are dropped so lxml elements
+    have the same children as stdlib ones, and syntax errors are raised
+    as ET.ParseError either way.  Entities are never expanded and nothing
+    is fetched over the network, whatever the installed lxml defaults.
+    """
+    if not HAS_LXML:
+        yield from ET.iterparse(filepath, events=("start", "end"))
+        return
+    try:
+        yield from lxml_etree.iterparse(
+            filepath, events=("start", "end"),
+            remove_comments=True, remove_pis=True,
+            resolve_entities=False, no_network=True)
+    except lxml_etree.XMLSyntaxError as exc:
+        err = ET.ParseError(str(exc))
+        err.position = exc.position
+        raise err from exc
+
+
+def _children_map(el: ET.Element) -> Dict[str, Optional[str]]:
+    """Map child tag -> raw text in one pass (first match wins, like find)."""
+    return {child.tag: child.text for child in reversed(el)}
+
+
+def _get(texts: Dict[str, Optional[str]], tag: str, default: str) -> str:
+    text = texts.get(tag)
+    if text:
+        return text.strip()
     return default
 
 
-def _get_int(el: ET.Element, tag: str, default: int) -> int:
+# int()/float() ignore surrounding whitespace, so the text is parsed as
+# is; a missing tag returns *default* without a str() round trip.
+def _get_int(texts: Dict[str, Optional[str]], tag: str, default: int) -> int:
+    text = texts.get(tag)
+    if not text:
+        return default
     try:
-        return int(_get(el, tag, str(default)))
+        return int(text)
     except ValueError:
         return default
 
 
-def _get_float(el: ET.Element, tag: str, default: float) -> float:
+def _get_float(texts: Dict[str, Optional[str]], tag: str, default: float) -> float:
+    text = texts.get(tag)
+    if not text:
+        return default
     try:
-        return float(_get(el, tag, str(default)))
+        return float(text)
     except ValueError:
         return default
 
 
-def _get_bool(el: ET.Element, tag: str, default: bool) -> bool:
-    val = _get(el, tag, "").lower()
-    if val in ("true", "yes", "1", "biotic"):
-        return True
-    if val in ("false", "no", "0", "abiotic"):
-        return False
-    return default
+def _get_bool(texts: Dict[str, Optional[str]], tag: str, default: bool) -> bool:
+    val = _get(texts, tag, "")
+    # Exported files are already lower-case; only lower() on a miss
+    flag = _BOOL_MAP.get(val)
+    if flag is None:
+        flag = _BOOL_MAP.get(val.lower(), default)
+    return flag
+
+
+# ── XML section readers (used by import_xml) ────────────────────────────
+# Each element's children are collected once with _children_map, so field
+# lookups are dict hits instead of repeated linear el.find() scans.
+
+def _read_path(proj: CompLaBProject, p: ET.Element) -> None:
+    p_txt = _children_map(p)
+    proj.path_settings.src_path = _get(p_txt, "src_path", "src")
+    proj.path_settings.input_path = _get(p_txt, "input_path", "input")
+    proj.path_settings.output_path = _get(p_txt, "output_path", "output")
+
+
+def _read_simulation_mode(proj: CompLaBProject, sm_el: ET.Element) -> None:
+    sm_txt = _children_map(sm_el)
+    proj.simulation_mode.biotic_mode = _get_bool(sm_txt, "biotic_mode", True)
+    proj.simulation_mode.enable_kinetics = _get_bool(sm_txt, "enable_kinetics", True)
+    proj.simulation_mode.enable_abiotic_kinetics = _get_bool(
+        sm_txt, "enable_abiotic_kinetics", False)
+    proj.simulation_mode.enable_validation_diagnostics = _get_bool(
+        sm_txt, "enable_validation_diagnostics", False)
+
+
+def _read_lb_numerics(proj: CompLaBProject, lb: ET.Element) -> dict:
+    """Read <LB_numerics>; returns the <material_numbers> text map."""
+    mat_txt = {}
+    dom = lb.find("domain")
+    if dom is not None:
+        dom_txt = _children_map(dom)
+        proj.domain.nx = _get_int(dom_txt, "nx", 50)
+        proj.domain.ny = _get_int(dom_txt, "ny", 30)
+        proj.domain.nz = _get_int(dom_txt, "nz", 30)
+        proj.domain.dx = _get_float(dom_txt, "dx", 1.0)
+        proj.domain.dy = _get_float(dom_txt, "dy", 0.0)
+        proj.domain.dz = _get_float(dom_txt, "dz", 0.0)
+        proj.domain.unit = _get(dom_txt, "unit", "um")
+        proj.domain.characteristic_length = _get_float(
+            dom_txt, "characteristic_length", 30.0)
+        proj.domain.geometry_filename = _get(dom_txt, "filename", "geometry.dat")
+        mat = dom.find("material_numbers")
+        if mat is not None:
+            mat_txt = _children_map(mat)
+            proj.domain.pore = _get(mat_txt, "pore", "2")
+            proj.domain.solid = _get(mat_txt, "solid", "0")
+            proj.domain.bounce_back = _get(mat_txt, "bounce_back", "1")
+
+    lb_txt = _children_map(lb)
+    proj.fluid.delta_P = _get_float(lb_txt, "delta_P", 0.0)
+    proj.fluid.peclet = _get_float(lb_txt, "Peclet", 0.0)
+    proj.fluid.tau = _get_float(lb_txt, "tau", 0.8)
+    proj.fluid.track_performance = _get_bool(lb_txt, "track_performance", False)
+
+    it = lb.find("iteration")
+    if it is not None:
+        it_txt = _children_map(it)
+        proj.iteration.ns_max_iT1 = _get_int(it_txt, "ns_max_iT1", 100000)
+        proj.iteration.ns_max_iT2 = _get_int(it_txt, "ns_max_iT2", 100000)
+        proj.iteration.ns_converge_iT1 = _get_float(it_txt, "ns_converge_iT1", 1e-8)
+        proj.iteration.ns_converge_iT2 = _get_float(it_txt, "ns_converge_iT2", 1e-6)
+        proj.iteration.ade_max_iT = _get_int(it_txt, "ade_max_iT", 10000000)
+        proj.iteration.ade_converge_iT = _get_float(it_txt, "ade_converge_iT", 1e-8)
+        proj.iteration.ns_rerun_iT0 = _get_int(it_txt, "ns_rerun_iT0", 0)
+        proj.iteration.ade_rerun_iT0 = _get_int(it_txt, "ade_rerun_iT0", 0)
+        proj.iteration.ns_update_interval = _get_int(it_txt, "ns_update_interval", 1)
+        proj.iteration.ade_update_interval = _get_int(it_txt, "ade_update_interval", 1)
+    return mat_txt
+
+
+def _read_chemistry(proj: CompLaBProject, chem: ET.Element) -> None:
+    n_subs = _get_int(_children_map(chem), "number_of_substrates", 0)
+    for i in range(n_subs):
+        s_el = chem.find(f"substrate{i}")
+        if s_el is None:
+            continue
+        s_txt = _children_map(s_el)
+        sub = Substrate()
+        sub.name = _get(s_txt, "name_of_substrates", f"substrate_{i}")
+        sub.initial_concentration = _get_float(s_txt, "initial_concentration", 0.0)
+        diff = s_el.find("substrate_diffusion_coefficients")
+        if diff is not None:
+            diff_txt = _children_map(diff)
+            sub.diffusion_in_pore = _get_float(diff_txt, "in_pore", 1e-9)
+            sub.diffusion_in_biofilm = _get_float(diff_txt, "in_biofilm", 2e-10)
+        sub.left_boundary_type = _get(s_txt, "left_boundary_type", "Dirichlet")
+        sub.right_boundary_type = _get(s_txt, "right_boundary_type", "Neumann")
+        sub.left_boundary_condition = _get_float(s_txt, "left_boundary_condition", 0.0)
+        sub.right_boundary_condition = _get_float(s_txt, "right_boundary_condition", 0.0)
+        proj.substrates.append(sub)
+
+
+def _read_microbiology(proj: CompLaBProject,
+                       mb_el: ET.Element) -> List[Tuple[int, Microbe]]:
+    """Read <microbiology>; returns (xml index, microbe) pairs."""
+    mb_txt = _children_map(mb_el)
+    proj.microbiology.maximum_biomass_density = _get_float(
+        mb_txt, "maximum_biomass_density", 100.0)
+    proj.microbiology.thrd_biofilm_fraction = _get_float(
+        mb_txt, "thrd_biofilm_fraction", 0.1)
+    proj.microbiology.ca_method = _get(mb_txt, "CA_method", "fraction")
+    n_mic = _get_int(mb_txt, "number_of_microbes", 0)
+
+    read = []
+    for i in range(n_mic):
+        m_el = mb_el.find(f"microbe{i}")
+        if m_el is None:
+            continue
+        m_txt = _children_map(m_el)
+        mic = Microbe()
+        mic.name = _get(m_txt, "name_of_microbes", f"microbe_{i}")
+        mic.solver_type = _get(m_txt, "solver_type", "CA").upper()
+        if mic.solver_type in ("CELLULAR AUTOMATA", "CELLULAR_AUTOMATA"):
+            mic.solver_type = "CA"
+        elif mic.solver_type in ("LATTICE BOLTZMANN", "LB"):
+            mic.solver_type = "LBM"
+        elif mic.solver_type in ("FINITE DIFFERENCE", "FINITE_DIFFERENCE"):
+            mic.solver_type = "FD"
+        mic.reaction_type = _get(m_txt, "reaction_type", "kinetics").lower()
+        mic.initial_densities = _get(m_txt, "initial_densities", "99.0")
+        mic.decay_coefficient = _get_float(m_txt, "decay_coefficient", 0.0)
+        mic.viscosity_ratio_in_biofilm = _get_float(
+            m_txt, "viscosity_ratio_in_biofilm", 10.0)
+        mic.half_saturation_constants = _get(m_txt, "half_saturation_constants", "")
+        mic.maximum_uptake_flux = _get(m_txt, "maximum_uptake_flux", "")
+        mic.left_boundary_type = _get(m_txt, "left_boundary_type", "Neumann")
+        mic.right_boundary_type = _get(m_txt, "right_boundary_type", "Neumann")
+        mic.left_boundary_condition = _get_float(
+            m_txt, "left_boundary_condition", 0.0)
+        mic.right_boundary_condition = _get_float(
+            m_txt, "right_boundary_condition", 0.0)
+        bd = m_el.find("biomass_diffusion_coefficients")
+        if bd is not None:
+            bd_txt = _children_map(bd)
+            mic.biomass_diffusion_in_pore = _get_float(bd_txt, "in_pore", -99.0)
+            mic.biomass_diffusion_in_biofilm = _get_float(bd_txt, "in_biofilm", -99.0)
+        proj.microbiology.microbes.append(mic)
+        read.append((i, mic))
+    return read
+
+
+def _read_equilibrium(proj: CompLaBProject, eq_el: ET.Element) -> None:
+    eq_txt = _children_map(eq_el)
+    proj.equilibrium.enabled = _get_bool(eq_txt, "enabled", False)
+    comp_text = _get(eq_txt, "components", "")
+    if comp_text:
+        proj.equilibrium.component_names = comp_text.split()
+    # Solver parameters
+    proj.equilibrium.max_iterations = _get_int(eq_txt, "max_iterations", 200)
+    proj.equilibrium.tolerance = _get_float(eq_txt, "tolerance", 1e-10)
+    proj.equilibrium.anderson_depth = _get_int(eq_txt, "anderson_depth", 4)
+    proj.equilibrium.beta = _get_float(eq_txt, "beta", 1.0)
+    st_el = eq_el.find("stoichiometry")
+    if st_el is not None:
+        st_txt = _children_map(st_el)
+        n_subs = len(proj.substrates)
+        for i in range(n_subs):
+            text = st_txt.get(f"species{i}")
+            if text:
+                row = _parse_row(text)
+            else:
+                row = [0.0] * len(proj.equilibrium.component_names)
+            proj.equilibrium.stoichiometry.append(row)
+    lk_el = eq_el.find("logK")
+    if lk_el is not None:
+        lk_txt = _children_map(lk_el)
+        n_subs = len(proj.substrates)
+        for i in range(n_subs):
+            text = lk_txt.get(f"species{i}")
+            if text:
+                proj.equilibrium.log_k.append(float(text.strip()))
+            else:
+                proj.equilibrium.log_k.append(0.0)
+
+
+def _read_io(proj: CompLaBProject, io_el: ET.Element) -> None:
+    io_txt = _children_map(io_el)
+    proj.io_settings.read_ns_file = _get_bool(io_txt, "read_NS_file", False)
+    proj.io_settings.read_ade_file = _get_bool(io_txt, "read_ADE_file", False)
+    proj.io_settings.ns_filename = _get(io_txt, "ns_filename", "nsLattice")
+    proj.io_settings.mask_filename = _get(io_txt, "mask_filename", "maskLattice")
+    proj.io_settings.subs_filename = _get(io_txt, "subs_filename", "subsLattice")
+    proj.io_settings.bio_filename = _get(io_txt, "bio_filename", "bioLattice")
+    proj.io_settings.save_vtk_interval = _get_int(io_txt, "save_VTK_interval", 1000)
+    proj.io_settings.save_chk_interval = _get_int(io_txt, "save_CHK_interval", 1000000)
+
+
+# Top-level tag -> reader; import_xml keeps each reader's return value
+# under its tag.  <equilibrium> is handled separately (read last).
+_SECTION_READERS = {
+    "path": _read_path,
+    "simulation_mode": _read_simulation_mode,
+    "LB_numerics": _read_lb_numerics,
+    "chemistry": _read_chemistry,
+    "microbiology": _read_microbiology,
+    "IO": _read_io,
+}
+
+
+def _save_meta() -> dict:
+    return {
+        "version": "2.1",
+        "saved": datetime.datetime.now().isoformat(),
+    }
+
+
+def _all_finite(val) -> bool:
+    """True unless a float anywhere in *val* is NaN or infinite."""
+    if isinstance(val, float):
+        return math.isfinite(val)
+    if is_dataclass(val):
+        return all(_all_finite(getattr(val, f.name)) for f in fields(val))
+    if isinstance(val, list):
+        return all(map(_all_finite, val))
+    return True
 
 
 def _project_to_dict(proj: CompLaBProject) -> dict:
-    """Serialize project to a JSON-friendly dict."""
-    from dataclasses import asdict
-    return asdict(proj)
+    """Serialize project to a JSON-friendly dict.
+
+    Unlike dataclasses.asdict this does not deep-copy leaf values: lists
+    such as the stoichiometry matrix are shared with *proj*, so the result
+    must be treated as read-only and serialized right away.
+    """
+    return _shallow_asdict(proj)
+
+
+def _shallow_asdict(obj) -> dict:
+    return {f.name: _to_plain(getattr(obj, f.name)) for f in fields(obj)}
+
+
+def _to_plain(val):
+    if is_dataclass(val):
+        return _shallow_asdict(val)
+    if isinstance(val, list) and val and is_dataclass(val[0]):
+        return [_shallow_asdict(v) for v in val]
+    return val
 
 
 def _dict_to_project(d: dict) -> CompLaBProject:
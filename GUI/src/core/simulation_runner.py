@@ -13,29 +13,50 @@ Supports:
 import os
 import re
 import signal
-import struct
+import selectors
 import time
 import datetime
 import logging
 import subprocess
 from pathlib import Path
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QThread, Signal, SIGNAL
+
+from .xml_diagnostic import diagnose_crash
 
 log = logging.getLogger("complab.runner")
 
+# Iteration progress in solver output, as one alternation so each line
+# costs a single search; m.lastgroup says which value matched.
+#   max: "ade_max_iT = 5000", "│ SIMULATION: max_iter=5000, ..."
+#   cur: "iT = 1200",         "║ ITERATION 1200  |  Time: ..."
+_RE_PROGRESS = re.compile(
+    r"(?:ade_max_iT\s*=\s*|max_iter=)(?P<max>\d+)"
+    r"|(?:iT\s*=\s*|ITERATION\s+)(?P<cur>\d+)")
+
+# Shown after "MPI command not found"
+_MPI_NOT_FOUND_HELP = (
+    "Make sure MPI is installed and the path is correct.",
+    "  Linux:   sudo apt install openmpi-bin",
+    "  macOS:   brew install open-mpi",
+    "  Windows: Install MS-MPI from microsoft.com",
+    "Or go to the Parallel panel and use Auto-detect / Browse.",
+)
+
 
 class SimulationRunner(QThread):
     """Runs the CompLaB3D solver as a subprocess.
 
     Signals:
-        output_line(str): Each line of stdout/stderr.
+        output_line(str): Status and error lines from the runner itself.
+        output_lines(list): Solver stdout/stderr, one batch per pipe read.
         progress(int, int): (current_iteration, max_iterations)
         finished_signal(int, str): (return_code, summary_message)
         diagnostic_report(str): Crash diagnostic text (emitted on failure).
     """
 
     output_line = Signal(str)
+    output_lines = Signal(list)
     progress = Signal(int, int)
     finished_signal = Signal(int, str)
     diagnostic_report = Signal(str)
@@ -140,45 +161,67 @@ class SimulationRunner(QThread):
                 cwd=self._cwd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                bufsize=1,
+                # Binary pipe: _iter_batches polls it, reads it in chunks
+                # and splits/decodes lines itself.
                 # Put child into its own process group so we can kill the
                 # whole MPI tree with os.killpg() instead of just the
-                # launcher.  Only available on POSIX.
-                **({'preexec_fn': os.setsid} if os.name != 'nt' else {}),
+                # launcher.  Only available on POSIX.  Unlike preexec_fn,
+                # start_new_session keeps the vfork/posix_spawn fast path
+                # and is safe to use from this worker thread.
+                start_new_session=(os.name != 'nt'),
+                # On Windows, keep the console-mode solver / mpiexec from
+                # opening a console window next to the GUI (0 elsewhere).
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
             )
             log.info("[RUNNER] Subprocess PID=%d  started", self._process.pid)
 
-            for line in iter(self._process.stdout.readline, ""):
+            # Bound methods and the line count live in locals for the
+            # per-line loop below
+            search_progress = _RE_PROGRESS.search
+            emit_progress = self.progress.emit
+            last_progress = None
+            lines_read = 0
+            for batch in _iter_batches(self._process.stdout):
                 if self._cancelled:
                     log.info("[RUNNER] Cancel flag detected in read loop")
                     self._kill_process_tree()
                     self.output_line.emit(
                         "-- Simulation cancelled by user --")
                     break
-                line = line.rstrip("\n")
-                self._lines_read += 1
+                if not batch:
+                    continue
 
-                # Diagnostic: log every 500th line and the first 5
-                if self._lines_read <= 5 or self._lines_read % 500 == 0:
-                    log.debug("[RUNNER] line #%d (len=%d): %.120s",
-                              self._lines_read, len(line), line)
-
-                self.output_line.emit(line)
+                # One queued signal per read instead of one per line
+                self.output_lines.emit(batch)
                 if log_file:
-                    log_file.write(line + "\n")
-                # Parse iteration progress
-                m = re.search(r"iT\s*=\s*(\d+)", line)
-                if m:
-                    cur = int(m.group(1))
-                    if cur > max_it:
-                        max_it = cur
-                    self.progress.emit(cur, max_it)
-                m2 = re.search(r"ade_max_iT\s*=\s*(\d+)", line)
-                if m2:
-                    max_it = int(m2.group(1))
+                    log_file.write("\n".join(batch) + "\n")
+
+                for line in batch:
+                    lines_read += 1
+
+                    # Diagnostic: log every 500th line and the first 5
+                    if lines_read <= 5 or lines_read % 500 == 0:
+                        log.debug("[RUNNER] line #%d (len=%d): %.120s",
+                                  lines_read, len(line), line)
+
+                    # Parse iteration progress.  Every match contains "iT",
+                    # "IT" or "iter", so most lines skip the regex entirely.
+                    if "iT" in line or "IT" in line or "iter" in line:
+                        m = search_progress(line)
+                        if m is None:
+                            pass
+                        elif m.lastgroup == "max":
+                            max_it = int(m.group("max"))
+                        else:
+                            cur = int(m.group("cur"))
+                            if cur > max_it:
+                                max_it = cur
+                            # Several lines can report the same iteration;
+                            # only a change is worth a queued signal
+                            if (cur, max_it) != last_progress:
+                                last_progress = (cur, max_it)
+                                emit_progress(cur, max_it)
+                self._lines_read = lines_read
 
             log.info("[RUNNER] Read loop exited after %d lines "
                      "(cancelled=%s)", self._lines_read, self._cancelled)
@@ -190,16 +233,8 @@ class SimulationRunner(QThread):
             if self._mpi_enabled:
                 self.output_line.emit(
                     f"ERROR: MPI command not found: {self._mpi_command}")
-                self.output_line.emit(
-                    "Make sure MPI is installed and the path is correct.")
-                self.output_line.emit(
-                    "  Linux:   sudo apt install openmpi-bin")
-                self.output_line.emit(
-                    "  macOS:   brew install open-mpi")
-                self.output_line.emit(
-                    "  Windows: Install MS-MPI from microsoft.com")
-                self.output_line.emit(
-                    "Or go to the Parallel panel and use Auto-detect / Browse.")
+                for hint in _MPI_NOT_FOUND_HELP:
+                    self.output_line.emit(hint)
             else:
                 self.output_line.emit(
                     f"ERROR: Executable not found: {self._exe}")
@@ -238,7 +273,9 @@ class SimulationRunner(QThread):
         # Convert unsigned 32-bit Windows exit codes to signed to avoid
         # OverflowError in Qt Signal(int, str) which expects a C signed int.
         if rc > 2147483647 or rc < -2147483648:
-            rc = struct.unpack('i', struct.pack('I', rc & 0xFFFFFFFF))[0]
+            rc &= 0xFFFFFFFF
+            if rc & 0x80000000:
+                rc -= 1 << 32
 
         # ── Run crash diagnostics on failure ───────────────────────
         if rc != 0 and not self._cancelled:
@@ -307,12 +344,16 @@ class SimulationRunner(QThread):
     # ------------------------------------------------------------------
     def _run_crash_diagnostic(self, rc: int):
         """Analyse CompLaB.xml + kinetics headers and emit a report."""
+        # The report only goes out through these two signals; skip the
+        # XML/header analysis when nobody is listening (headless runs).
+        if not (self.receivers(SIGNAL("output_line(QString)"))
+                or self.receivers(SIGNAL("diagnostic_report(QString)"))):
+            return
         xml_path = os.path.join(self._cwd, "CompLaB.xml")
         if not os.path.isfile(xml_path):
             return
 
         try:
-            from .xml_diagnostic import diagnose_crash
             report = diagnose_crash(xml_path, rc, kinetics_dir=self._cwd)
         except Exception as exc:
             report = f"Crash diagnostic failed: {exc}"
@@ -322,3 +363,69 @@ class SimulationRunner(QThread):
             self.output_line.emit(line)
 
         self.diagnostic_report.emit(report)
+
+
+def _iter_batches(stream, chunk_size: int = 65536,
+                  poll_interval: float = 0.1):
+    """Yield lists of decoded lines from a binary pipe, one list per read.
+
+    Each read returns whatever is already in the pipe (up to *chunk_size*)
+    instead of waiting for a full buffer, so a quiet solver's lines come
+    through one at a time while a chatty one is handled in batches of
+    however many lines a single read picked up.
+    Line ends are "\n", "\r\n" or "\r", as in text mode.
+
+    An empty list is yielded whenever *poll_interval* seconds pass without
+    output, so the caller can act on a cancel even if the pipe never
+    closes (e.g. a detached grandchild still holds it open).
+    """
+    pending = b""
+    for chunk in _read_chunks(stream, chunk_size, poll_interval):
+        if not chunk:
+            yield []
+            continue
+        data = pending + chunk
+        lines = data.splitlines()
+        # The last piece may be incomplete, or a "\r" whose "\n" is in
+        # the next chunk; hold it back until more data arrives.
+        if data.endswith(b"\n"):
+            pending = b""
+        elif data.endswith(b"\r"):
+            pending = lines.pop() + b"\r"
+        else:
+            pending = lines.pop()
+        if lines:
+            yield [raw.decode("utf-8", "replace") for raw in lines]
+    if pending:
+        yield [pending.rstrip(b"\r\n").decode("utf-8", "replace")]
+
+
+def _read_chunks(stream, chunk_size: int, poll_interval: float):
+    """Yield raw chunks from *stream* until EOF; b"" on an idle poll.
+
+    POSIX pipes are switched to non-blocking and polled with a selector.
+    Windows cannot select() on pipes, so there read1() simply blocks and
+    no idle chunks are produced.
+    """
+    if os.name == "nt":
+        while True:
+            chunk = stream.read1(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    fd = stream.fileno()
+    os.set_blocking(fd, False)
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while True:
+            if not sel.select(poll_interval):
+                yield b""
+                continue
+            try:
+                chunk = os.read(fd, chunk_size)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                return
+            yield chunk
@@ -40,9 +40,10 @@ def get_template_list():
 
 def create_from_template(key: str) -> CompLaBProject:
     """Create a project from template, including matching kinetics .hh code."""
-    if key not in TEMPLATES:
+    entry = TEMPLATES.get(key)
+    if entry is None:
         return CompLaBProject()
-    project = TEMPLATES[key][2]()
+    project = entry[2]()
     # Attach matching kinetics source code
     project.template_key = key
     info = get_kinetics_info(key)
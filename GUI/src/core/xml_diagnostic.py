@@ -45,6 +45,11 @@ _EXIT_CODE_MAP = {
     2:   ("File Not Found",
           "A required input file is missing."),
 }
+# Also key negative codes by their unsigned 32-bit form (e.g. 0xC0000374
+# as reported by Windows), so either representation is a single lookup.
+_EXIT_CODE_MAP.update(
+    {code + (1 << 32): info for code, info in _EXIT_CODE_MAP.items()
+     if code < 0})
 
 
 def diagnose_crash(xml_path: str, exit_code: int,
@@ -94,17 +99,21 @@ def diagnose_crash(xml_path: str, exit_code: int,
                              xml_path)
 
     # ── 2. Extract key counts from XML ─────────────────────────────────
-    nx = _xml_int(root, ".//domain/nx", 0)
-    ny = _xml_int(root, ".//domain/ny", 0)
-    nz = _xml_int(root, ".//domain/nz", 0)
+    # Sections are found with one ".//" scan each (so misplaced ones are
+    # still diagnosed) instead of one scan of the whole tree per value.
+    dom_el = _section(root, ".//domain")
+    sim_el = _section(root, ".//simulation_mode")
+    nx = _xml_int(dom_el, "nx", 0)
+    ny = _xml_int(dom_el, "ny", 0)
+    nz = _xml_int(dom_el, "nz", 0)
     n_subs = _xml_int(root, ".//chemistry/number_of_substrates", 0)
     n_mics = _xml_int(root, ".//microbiology/number_of_microbes", 0)
-    biotic = _xml_text(root, ".//simulation_mode/biotic_mode", "false").lower() in (
+    biotic = _xml_text(sim_el, "biotic_mode", "false").lower() in (
         "true", "yes", "1", "biotic")
-    kinetics_on = _xml_text(root, ".//simulation_mode/enable_kinetics", "false").lower() in (
+    kinetics_on = _xml_text(sim_el, "enable_kinetics", "false").lower() in (
         "true", "yes", "1")
     abiotic_kinetics_on = _xml_text(
-        root, ".//simulation_mode/enable_abiotic_kinetics", "false").lower() in (
+        sim_el, "enable_abiotic_kinetics", "false").lower() in (
         "true", "yes", "1")
 
     info.append(f"Domain: nx={nx}, ny={ny}, nz={nz}  (total={nx*ny*nz})")
@@ -114,7 +123,7 @@ def diagnose_crash(xml_path: str, exit_code: int,
                 f"abiotic kinetics: {abiotic_kinetics_on}")
 
     # ── 3. Geometry file size check ────────────────────────────────────
-    geom_fname = _xml_text(root, ".//domain/filename", "geometry.dat")
+    geom_fname = _xml_text(dom_el, "filename", "geometry.dat")
     input_path = _xml_text(root, ".//path/input_path", "input")
     xml_dir = str(Path(xml_path).parent)
 
@@ -165,6 +174,7 @@ def diagnose_crash(xml_path: str, exit_code: int,
 
     mb_el = root.find("microbiology")
     if mb_el is not None and biotic:
+        mat_el = dom_el.find("material_numbers")
         for i in range(n_mics):
             m_el = mb_el.find(f"microbe{i}")
             if m_el is None:
@@ -205,7 +215,6 @@ def diagnose_crash(xml_path: str, exit_code: int,
             # Material numbers vs initial densities
             solver = _xml_text(m_el, "solver_type", "").upper()
             if solver in ("CA", "CELLULAR AUTOMATA"):
-                mat_el = root.find(".//domain/material_numbers")
                 if mat_el is not None:
                     mat_text = _xml_text(mat_el, f"microbe{i}", "").strip()
                     dens_text = _xml_text(m_el, "initial_densities", "").strip()
@@ -319,6 +328,12 @@ def diagnose_crash(xml_path: str, exit_code: int,
 
 # ── Internal helpers ──────────────────────────────────────────────────────
 
+def _section(parent: ET.Element, path: str) -> ET.Element:
+    """First match of *path* under *parent*, or an empty element."""
+    el = parent.find(path)
+    return el if el is not None else ET.Element(path.rsplit("/", 1)[-1])
+
+
 def _xml_text(parent: ET.Element, path: str, default: str) -> str:
     el = parent.find(path)
     if el is not None and el.text:
@@ -340,6 +355,12 @@ def _xml_float(parent: ET.Element, path: str, default: float) -> float:
         return default
 
 
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_LINE_COMMENT_RE = re.compile(r'//.*')
+_ARRAY_INDEX_RE = re.compile(r'\b(C|subsR|B|bioR)\s*\[\s*(\d+)\s*\]')
+_SIZE_GUARD_RE = re.compile(r'(?:C|subsR|B|bioR)\s*\.\s*size\s*\(\s*\)')
+
+
 def _check_kinetics_header(
         kinetics_dir: str,
         filename: str,
@@ -374,15 +395,18 @@ def _check_kinetics_header(
     info.append(f"Analysing {filename} ({len(source)} bytes)")
 
     # Strip block comments and line comments for reliable matching
-    source_clean = re.sub(r'/\*.*?\*/', '', source, flags=re.DOTALL)
-    source_clean = re.sub(r'//.*', '', source_clean)
+    source_clean = _BLOCK_COMMENT_RE.sub('', source)
+    source_clean = _LINE_COMMENT_RE.sub('', source_clean)
 
-    # Find C[n] and subsR[n] accesses (substrate array)
+    # One pass for all array accesses: C[n] / subsR[n] index the substrate
+    # array, B[n] / bioR[n] the biomass array
     c_indices = set()
-    for m in re.finditer(r'\bC\s*\[\s*(\d+)\s*\]', source_clean):
-        c_indices.add(int(m.group(1)))
-    for m in re.finditer(r'\bsubsR\s*\[\s*(\d+)\s*\]', source_clean):
-        c_indices.add(int(m.group(1)))
+    b_indices = set()
+    for arr, idx in _ARRAY_INDEX_RE.findall(source_clean):
+        if arr == "C" or arr == "subsR":
+            c_indices.add(int(idx))
+        else:
+            b_indices.add(int(idx))
 
     if c_indices and n_subs > 0:
         max_c_idx = max(c_indices)
@@ -400,13 +424,6 @@ def _check_kinetics_header(
                 f"{filename}: substrate indices {sorted(c_indices)} — "
                 f"all within 0..{n_subs-1} OK")
 
-    # Find B[n] and bioR[n] accesses (biomass array)
-    b_indices = set()
-    for m in re.finditer(r'\bB\s*\[\s*(\d+)\s*\]', source_clean):
-        b_indices.add(int(m.group(1)))
-    for m in re.finditer(r'\bbioR\s*\[\s*(\d+)\s*\]', source_clean):
-        b_indices.add(int(m.group(1)))
-
     if b_indices and n_mics > 0:
         max_b_idx = max(b_indices)
         if max_b_idx >= n_mics:
@@ -424,8 +441,7 @@ def _check_kinetics_header(
                 f"all within 0..{n_mics-1} OK")
 
     # Check for .size() guards (good practice)
-    has_size_guard = bool(re.search(
-        r'(?:C|subsR|B|bioR)\s*\.\s*size\s*\(\s*\)', source_clean))
+    has_size_guard = bool(_SIZE_GUARD_RE.search(source_clean))
     if has_size_guard:
         info.append(f"{filename}: uses .size() bounds checks (good)")
     elif c_indices or b_indices:
@@ -437,6 +453,28 @@ def _check_kinetics_header(
             f"    >> Suggestion: add  if (C.size() > idx)  checks.")
 
 
+# Fixed parts of the report, shared by every call to _build_report
+_NO_ERRORS_NOTE = (
+    "-" * 72,
+    "  No configuration errors detected.",
+    "  The crash may be caused by:",
+    "    - A bug in the C++ solver",
+    "    - Numerical instability during iteration",
+    "    - Insufficient memory for the domain size",
+    "-" * 72,
+    "",
+)
+_FIX_CHECKLIST = (
+    "  1. Run 'Validate Configuration' in the Run panel",
+    "  2. Verify geometry file has exactly nx * ny * nz bytes",
+    "  3. Check that defineKinetics.hh array indices match substrate count",
+    "  4. Check half_saturation_constants / maximum_uptake_flux counts",
+    "  5. Re-export CompLaB.xml and run again",
+    "",
+    "=" * 72,
+)
+
+
 def _build_report(exit_code: int, code_name: str, code_desc: str,
                   errors: List[str], warnings: List[str],
                   info: List[str], xml_path: str) -> str:
@@ -463,14 +501,7 @@ def _build_report(exit_code: int, code_name: str, code_desc: str,
             lines.append(f"  {i}. {e}")
             lines.append("")
     else:
-        lines.append("-" * 72)
-        lines.append("  No configuration errors detected.")
-        lines.append("  The crash may be caused by:")
-        lines.append("    - A bug in the C++ solver")
-        lines.append("    - Numerical instability during iteration")
-        lines.append("    - Insufficient memory for the domain size")
-        lines.append("-" * 72)
-        lines.append("")
+        lines.extend(_NO_ERRORS_NOTE)
 
     if warnings:
         lines.append("-" * 72)
@@ -494,13 +525,7 @@ def _build_report(exit_code: int, code_name: str, code_desc: str,
     lines.append("-" * 72)
     if errors:
         lines.append("  Fix the errors above, then:")
-    lines.append("  1. Run 'Validate Configuration' in the Run panel")
-    lines.append("  2. Verify geometry file has exactly nx * ny * nz bytes")
-    lines.append("  3. Check that defineKinetics.hh array indices match substrate count")
-    lines.append("  4. Check half_saturation_constants / maximum_uptake_flux counts")
-    lines.append("  5. Re-export CompLaB.xml and run again")
-    lines.append("")
-    lines.append("=" * 72)
+    lines.extend(_FIX_CHECKLIST)
 
     return "\n".join(lines)
 
@@ -17,6 +17,22 @@ from PySide6.QtGui import QFont, QSyntaxHighlighter, QTextCharFormat, QColor
 import re
 
 
+_CPP_KEYWORDS = [
+    "namespace", "struct", "class", "const", "constexpr", "static",
+    "double", "int", "float", "void", "return", "if", "else", "for",
+    "while", "using", "typedef", "template", "typename", "true",
+    "false", "T", "plint", "pluint", "std", "vector",
+]
+
+# Compiled once at import; all keywords share one format, so they are a
+# single whole-word alternation (one pass per block instead of one each).
+_KEYWORD_RE = re.compile(r"\b(?:" + "|".join(_CPP_KEYWORDS) + r")\b")
+_NUMBER_RE = re.compile(r"\b\d+\.?\d*(?:[eE][+-]?\d+)?\b")
+_STRING_RE = re.compile(r'"[^"]*"')
+_COMMENT_RE = re.compile(r"//[^\n]*")
+_PREPROC_RE = re.compile(r"^\s*#.*$", re.MULTILINE)
+
+
 class CppHighlighter(QSyntaxHighlighter):
     """Basic C++ syntax highlighter for kinetics editor."""
 
@@ -27,30 +43,23 @@ class CppHighlighter(QSyntaxHighlighter):
         kw_fmt = QTextCharFormat()
         kw_fmt.setForeground(QColor("#569cd6"))
         kw_fmt.setFontWeight(QFont.Weight.Bold)
-        keywords = [
-            "namespace", "struct", "class", "const", "constexpr", "static",
-            "double", "int", "float", "void", "return", "if", "else", "for",
-            "while", "using", "typedef", "template", "typename", "true",
-            "false", "T", "plint", "pluint", "std", "vector",
-        ]
-        for kw in keywords:
-            self._rules.append((re.compile(rf"\b{kw}\b"), kw_fmt))
+        self._rules.append((_KEYWORD_RE, kw_fmt))
 
         num_fmt = QTextCharFormat()
         num_fmt.setForeground(QColor("#b5cea8"))
-        self._rules.append((re.compile(r"\b\d+\.?\d*(?:[eE][+-]?\d+)?\b"), num_fmt))
+        self._rules.append((_NUMBER_RE, num_fmt))
 
         str_fmt = QTextCharFormat()
         str_fmt.setForeground(QColor("#ce9178"))
-        self._rules.append((re.compile(r'"[^"]*"'), str_fmt))
+        self._rules.append((_STRING_RE, str_fmt))
 
         comment_fmt = QTextCharFormat()
         comment_fmt.setForeground(QColor("#6a9955"))
-        self._rules.append((re.compile(r"//[^\n]*"), comment_fmt))
+        self._rules.append((_COMMENT_RE, comment_fmt))
 
         preproc_fmt = QTextCharFormat()
         preproc_fmt.setForeground(QColor("#c586c0"))
-        self._rules.append((re.compile(r"^\s*#.*$", re.MULTILINE), preproc_fmt))
+        self._rules.append((_PREPROC_RE, preproc_fmt))
 
     def highlightBlock(self, text):
         for pattern, fmt in self._rules:
@@ -20,7 +20,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
-from ..core.templates import get_template_list, create_from_template
+from ..core.templates import (
+    TEMPLATES, get_template_list, create_from_template,
+)
 from ..core.kinetics_templates import get_kinetics_info
 
 
@@ -194,11 +196,9 @@ class NewProjectDialog(QDialog):
         info = get_kinetics_info(self._selected_key)
 
         # Update project name suggestion
-        templates = get_template_list()
-        for key, name, desc in templates:
-            if key == self._selected_key:
-                self._name_edit.setText(name.replace(" ", "_"))
-                break
+        entry = TEMPLATES.get(self._selected_key)
+        if entry:
+            self._name_edit.setText(entry[0].replace(" ", "_"))
 
         if not info:
             self._info_label.setText("No additional information available.")
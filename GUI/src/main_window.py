@@ -53,6 +53,11 @@ from .dialogs.kinetics_editor_dialog import KineticsEditorDialog
 from .dialogs.preferences_dialog import PreferencesDialog
 from .dialogs.about_dialog import AboutDialog
 
+# Resolved once: Path.resolve() walks the whole path with syscalls, and
+# _find_executable runs on every Run click.
+_GUI_DIR = str(Path(__file__).resolve().parent.parent)
+_REPO_ROOT = str(Path(_GUI_DIR).parent)
+
 
 class CompLaBMainWindow(QMainWindow):
     """Main application window with COMSOL-style 4-panel layout."""
@@ -68,6 +73,7 @@ class CompLaBMainWindow(QMainWindow):
         self._project_file = ""
         self._runner = None
         self._modified = False
+        self._which_cache = {}
 
         self._setup_panels()
         self._setup_layout()
@@ -624,15 +630,13 @@ class CompLaBMainWindow(QMainWindow):
         import sys
         exe_name = "complab.exe" if sys.platform == "win32" else "complab"
 
-        import shutil as _shutil
-
         # 1. Check user-configured path first (file path or command name)
         configured = self._config.get("complab_executable", "")
         if configured:
             if os.path.isfile(configured):
                 return configured
             # Try resolving as a command name on PATH
-            resolved = _shutil.which(configured)
+            resolved = self._which(configured)
             if resolved:
                 return resolved
 
@@ -645,10 +649,10 @@ class CompLaBMainWindow(QMainWindow):
             os.path.join(work_dir, "GUI", "bin"),        # GUI bundled
         ]
         # Also search relative to the GUI directory
-        gui_dir = str(Path(__file__).resolve().parent.parent)
+        gui_dir = _GUI_DIR
         search_dirs.append(os.path.join(gui_dir, "bin"))
         # And one level up from GUI (the repo root)
-        repo_root = str(Path(gui_dir).parent)
+        repo_root = _REPO_ROOT
         if repo_root != work_dir:
             search_dirs.extend([
                 repo_root,
@@ -662,12 +666,30 @@ class CompLaBMainWindow(QMainWindow):
                 return candidate
 
         # 3. Last resort: check system PATH
-        on_path = _shutil.which(exe_name)
+        on_path = self._which(exe_name)
         if on_path:
             return on_path
 
         return ""
 
+    def _which(self, cmd: str) -> str:
+        """``shutil.which`` that remembers hits for the current PATH.
+
+        A PATH lookup stats every PATH entry; a remembered hit costs one
+        stat to confirm it still exists.  Misses are not remembered, so
+        a solver installed mid-session is still found.
+        """
+        import shutil as _shutil
+
+        key = (cmd, os.environ.get("PATH", ""))
+        hit = self._which_cache.get(key)
+        if hit and os.path.isfile(hit):
+            return hit
+        hit = _shutil.which(cmd)
+        if hit:
+            self._which_cache[key] = hit
+        return hit or ""
+
     def _run_simulation(self):
         # ── Guard: prevent starting a second simulation ────────────
         if self._runner and self._runner.isRunning():
@@ -723,8 +745,9 @@ class CompLaBMainWindow(QMainWindow):
         file_errors = self._project.validate_files(work_dir)
         all_issues.extend(file_errors)
         # Separate warnings (non-blocking) from errors (blocking)
-        warnings = [e for e in all_issues if "Warning:" in e]
-        errors = [e for e in all_issues if "Warning:" not in e]
+        warnings, errors = [], []
+        for e in all_issues:
+            (warnings if "Warning:" in e else errors).append(e)
         for w in warnings:
             self._console.log_warning(f"  {w}")
         if errors:
@@ -762,6 +785,8 @@ class CompLaBMainWindow(QMainWindow):
         log.info("[MAIN] New SimulationRunner id=%s created", id(self._runner))
         self._runner.output_line.connect(self._console.append)
         self._runner.output_line.connect(self._run_panel.on_output_line)
+        self._runner.output_lines.connect(self._console.append_lines)
+        self._runner.output_lines.connect(self._run_panel.on_output_lines)
         self._runner.progress.connect(self._run_panel.on_progress)
         self._runner.progress.connect(
             lambda c, m: self._console.set_progress(c, m))
@@ -850,12 +875,29 @@ class CompLaBMainWindow(QMainWindow):
         self._console.log_info(
             f"Starting parameter sweep: {len(runs)} runs")
 
+        import shutil
+        from .panels.sweep_panel import SWEEP_PARAMS
+
+        # No sweep parameter touches the geometry, so its name and source
+        # file are the same for every run: look them up once.
+        geom_name = self._project.domain.geometry_filename or "geometry.dat"
+        input_subdir = self._project.path_settings.input_path or "input"
+        geom_src = None
+        # Search source geometry in order: base_dir/input/, base_dir/
+        for src_dir in [
+            os.path.join(base_dir, input_subdir),
+            base_dir,
+        ]:
+            candidate = os.path.join(src_dir, geom_name)
+            if os.path.isfile(candidate):
+                geom_src = candidate
+                break
+
         for i, (param_name, value) in enumerate(runs):
             run_dir = os.path.join(base_dir, f"sweep_{i+1:03d}_{param_name}_{value}")
             os.makedirs(run_dir, exist_ok=True)
 
             # Apply swept parameter to project
-            from .panels.sweep_panel import SWEEP_PARAMS
             if param_name in SWEEP_PARAMS:
                 section, field = SWEEP_PARAMS[param_name]
                 self._apply_sweep_param(section, field, value)
@@ -869,22 +911,12 @@ class CompLaBMainWindow(QMainWindow):
                 continue
 
             # Copy geometry file into input/ subdirectory (where C++ expects it)
-            import shutil
-            geom_name = self._project.domain.geometry_filename or "geometry.dat"
-            input_subdir = self._project.path_settings.input_path or "input"
-            input_dir = os.path.join(run_dir, input_subdir)
-            geom_dst = os.path.join(input_dir, geom_name)
-            if not os.path.isfile(geom_dst):
-                # Search source geometry in order: base_dir/input/, base_dir/
-                for src_dir in [
-                    os.path.join(base_dir, input_subdir),
-                    base_dir,
-                ]:
-                    geom_src = os.path.join(src_dir, geom_name)
-                    if os.path.isfile(geom_src):
-                        os.makedirs(input_dir, exist_ok=True)
-                        shutil.copy2(geom_src, geom_dst)
-                        break
+            if geom_src:
+                input_dir = os.path.join(run_dir, input_subdir)
+                os.makedirs(input_dir, exist_ok=True)
+                geom_dst = os.path.join(input_dir, geom_name)
+                if not os.path.isfile(geom_dst):
+                    shutil.copy2(geom_src, geom_dst)
 
             self._console.log_info(
                 f"  Run {i+1}/{len(runs)}: {param_name} = {value} -> {run_dir}")
@@ -214,9 +214,86 @@ class DomainPanel(BasePanel):
             pass
 
         # Fall back to text format
-        total = 0
-        tokens_per_line = {}  # count -> frequency
+        try:
+            tokens_per_line = DomainPanel._digit_tokens_per_line(filepath)
+        except Exception:
+            tokens_per_line = None
+        if tokens_per_line is not None:
+            total = sum(n * freq for n, freq in tokens_per_line.items())
+        else:
+            tokens_per_line = {}  # count -> frequency
+            total = DomainPanel._scan_text_tokens(filepath, tokens_per_line)
+            if total is None:
+                return 0, 0
+
+        # Detect nz from consistent multi-value lines
+        nz_hint = 0
+        if tokens_per_line:
+            # Find the most common token count
+            most_common = max(tokens_per_line, key=tokens_per_line.get)
+            if most_common > 1:
+                # Check if at least 90% of lines have this count
+                total_lines = sum(tokens_per_line.values())
+                if tokens_per_line[most_common] >= total_lines * 0.9:
+                    nz_hint = most_common
+
+        return total, nz_hint
+
+    @staticmethod
+    def _digit_tokens_per_line(filepath, chunk_size=1 << 21):
+        """Histogram {tokens_per_line: n_lines} for digit-only text files.
+
+        Geometry written by the generator and the solver holds only digits
+        and whitespace, so every token is a valid integer and the count
+        reduces to finding token starts, which numpy does per chunk.
+        Returns None if any other byte appears (the caller then falls
+        back to _scan_text_tokens, which validates each token).
+        """
+        import numpy as np
+
+        hist = {}
+        tail = b""
+        with open(filepath, "rb") as f:
+            while True:
+                block = f.read(chunk_size)
+                data = tail + block
+                if block:
+                    # Only count whole lines; keep the rest for the next read
+                    cut = max(data.rfind(b"\n"), data.rfind(b"\r")) + 1
+                    data, tail = data[:cut], data[cut:]
+                if data:
+                    # Charset check in one C pass: delete the allowed bytes
+                    if data.translate(None, b"0123456789 \t\r\n"):
+                        return None
+                    raw = np.frombuffer(data, dtype=np.uint8)
+                    digit = raw >= 48  # only digits are above whitespace
+                    starts = digit.copy()
+                    starts[1:] &= ~digit[:-1]
+                    if b" " not in data and b"\t" not in data:
+                        # One value per line (the solver's own format)
+                        n = int(np.count_nonzero(starts))
+                        if n:
+                            hist[1] = hist.get(1, 0) + n
+                    else:
+                        # int32 is plenty for line numbers within a chunk
+                        # and keeps the temporary at 4 bytes per byte read
+                        line_no = np.cumsum((raw == 10) | (raw == 13),
+                                            dtype=np.int32)
+                        per_line = np.bincount(line_no[starts])
+                        counts, freq = np.unique(
+                            per_line[per_line > 0], return_counts=True)
+                        for n, c in zip(counts.tolist(), freq.tolist()):
+                            hist[n] = hist.get(n, 0) + c
+                if not block:
+                    return hist
 
+    @staticmethod
+    def _scan_text_tokens(filepath, tokens_per_line):
+        """Count int()-parsable tokens line by line, filling *tokens_per_line*.
+
+        Returns the total, or None if the file cannot be read as text.
+        """
+        total = 0
         try:
             with open(filepath, "r") as f:
                 for line in f:
@@ -235,20 +312,8 @@ class DomainPanel(BasePanel):
                     if valid > 0:
                         tokens_per_line[valid] = tokens_per_line.get(valid, 0) + 1
         except Exception:
-            return 0, 0
-
-        # Detect nz from consistent multi-value lines
-        nz_hint = 0
-        if tokens_per_line:
-            # Find the most common token count
-            most_common = max(tokens_per_line, key=tokens_per_line.get)
-            if most_common > 1:
-                # Check if at least 90% of lines have this count
-                total_lines = sum(tokens_per_line.values())
-                if tokens_per_line[most_common] >= total_lines * 0.9:
-                    nz_hint = most_common
-
-        return total, nz_hint
+            return None
+        return total
 
     @staticmethod
     def _find_factorizations(total, nz_hint=0):
@@ -264,7 +264,8 @@ class ParallelPanel(BasePanel):
         try:
             result = subprocess.run(
                 [path, "--version"],
-                capture_output=True, text=True, timeout=5)
+                capture_output=True, text=True, timeout=5,
+                creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
             first_line = (result.stdout or result.stderr).strip().split('\n')[0]
             if first_line:
                 self._mpi_version_lbl.setText(f"Version: {first_line}")
@@ -25,7 +25,7 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 from PySide6.QtCore import Signal, QTimer, Qt
-from PySide6.QtGui import QFont, QTextCursor, QColor
+from PySide6.QtGui import QFont, QColor, QTextCursor, QTextCharFormat
 
 from .base_panel import BasePanel
 
@@ -36,6 +36,21 @@ log = logging.getLogger("complab.run_panel")
 # produces millions of output lines.
 _OUTPUT_MAX_LINES = 50000
 
+# Per-line output parsers, compiled once; bound .search saves the
+# attribute lookup on every output line.
+_search_iteration = re.compile(r"iT\s*=\s*(\d+)").search
+_search_ade_max = re.compile(r"ade_max_iT\s*=\s*(\d+)").search
+# The residual patterns are anchored at the first "ns" / "ade" of the
+# line (a later one cannot match if the first did not), so the greedy gap
+# is tried once per line instead of once per occurrence; an unanchored
+# search goes quadratic on long lines full of "ns" (e.g. "transport").
+_search_ns_residual = re.compile(
+    r"(?:(?![Nn][Ss]).)*"
+    r"[Nn][Ss].*[Rr]esidual\s*[:=]\s*([0-9.eE+-]+)").match
+_search_ade_residual = re.compile(
+    r"(?:(?![Aa][Dd][Ee]).)*"
+    r"[Aa][Dd][Ee].*(?:[Rr]esidual|[Cc]onverg)\s*[:=]\s*([0-9.eE+-]+)").match
+
 
 class RunPanel(BasePanel):
     """Comprehensive run controls: MPI config, validate, start, stop, monitor."""
@@ -244,6 +259,8 @@ class RunPanel(BasePanel):
             "  selection-background-color: #264f78;"
             "}")
         self._output_text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        # Ring buffer: the document drops its oldest lines past the limit
+        self._output_text.document().setMaximumBlockCount(_OUTPUT_MAX_LINES)
         output_layout.addWidget(self._output_text)
 
         # Error summary
@@ -309,7 +326,8 @@ class RunPanel(BasePanel):
                     import subprocess
                     result = subprocess.run(
                         [path, "--version"],
-                        capture_output=True, text=True, timeout=5)
+                        capture_output=True, text=True, timeout=5,
+                        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0))
                     first_line = result.stdout.strip().split('\n')[0]
                     self._mpi_status_lbl.setText(
                         f"Found: {path}\n{first_line}")
@@ -403,97 +421,97 @@ class RunPanel(BasePanel):
 
     def on_output_line(self, line: str):
         """Called for each line of simulation output - parse and display."""
-        # Append to output text with color coding
-        color = "#cccccc"
-        line_lower = line.lower()
-
-        if "error" in line_lower or "fail" in line_lower:
-            color = "#f44336"
-        elif "warning" in line_lower:
-            color = "#ffc107"
-        elif "converge" in line_lower or "complete" in line_lower:
-            color = "#5ca060"
-        elif line.startswith("---") or line.startswith("==="):
-            color = "#569cd6"
-        elif "iT =" in line or "iT=" in line:
-            color = "#9cdcfe"
-
         self._output_text.append(
-            f'<span style="color:{color};">{_escape_html(line)}</span>')
+            f'<span style="color:{_output_color(line)};">'
+            f'{_escape_html(line)}</span>')
+        self._scroll_output()
 
-        # ── Trim old lines to prevent unbounded memory growth ──────
-        doc = self._output_text.document()
-        overflow = doc.blockCount() - _OUTPUT_MAX_LINES
-        if overflow > 0:
-            cursor = QTextCursor(doc)
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            cursor.movePosition(
-                QTextCursor.MoveOperation.Down,
-                QTextCursor.MoveMode.KeepAnchor,
-                overflow,
-            )
-            cursor.removeSelectedText()
+        # Parse convergence data
+        self._parse_output_line(line)
 
+    def on_output_lines(self, lines: list):
+        """Called with a batch of output lines - one document edit per batch."""
+        if not lines:
+            return
+        doc = self._output_text.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        new_block = not doc.isEmpty()
+        cursor.beginEditBlock()
+        for line in lines:
+            if new_block:
+                cursor.insertBlock()
+            new_block = True
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(_output_color(line)))
+            cursor.insertText(line, fmt)
+        cursor.endEditBlock()
+        self._scroll_output()
+
+        for line in lines:
+            self._parse_output_line(line)
+
+    def _scroll_output(self):
         if self._auto_scroll_check.isChecked():
             sb = self._output_text.verticalScrollBar()
             sb.setValue(sb.maximum())
 
-        # Parse convergence data
-        self._parse_output_line(line)
-
     def _parse_output_line(self, line: str):
         """Extract iteration, residual, and phase info from output."""
-        # Iteration counter: iT = 1234
-        m = re.search(r"iT\s*=\s*(\d+)", line)
-        if m:
-            it = int(m.group(1))
-            self._current_iteration = it
-            self._iteration_history.append(it)
-
-        # Max iterations from XML echo: ade_max_iT = 50000
-        m2 = re.search(r"ade_max_iT\s*=\s*(\d+)", line)
-        if m2:
-            self._max_iterations = int(m2.group(1))
-            self._progress.setMaximum(self._max_iterations)
+        # Each pattern needs a literal that a plain substring test can
+        # look for first, so most lines never reach the regex engine.
+        if "iT" in line:
+            # Iteration counter: iT = 1234
+            m = _search_iteration(line)
+            if m:
+                it = int(m.group(1))
+                self._current_iteration = it
+                self._iteration_history.append(it)
+
+            # Max iterations from XML echo: ade_max_iT = 50000
+            m2 = _search_ade_max(line)
+            if m2:
+                self._max_iterations = int(m2.group(1))
+                self._progress.setMaximum(self._max_iterations)
+
+        if "esidual" in line or "onverg" in line:
+            # NS residual
+            m3 = _search_ns_residual(line)
+            if m3:
+                try:
+                    val = float(m3.group(1))
+                    self._ns_residual_history.append(val)
+                    self._ns_residual_label.setText(f"{val:.4e}")
+                except ValueError:
+                    pass
 
-        # NS residual
-        m3 = re.search(r"[Nn][Ss].*[Rr]esidual\s*[:=]\s*([0-9.eE+-]+)", line)
-        if m3:
-            try:
-                val = float(m3.group(1))
-                self._ns_residual_history.append(val)
-                self._ns_residual_label.setText(f"{val:.4e}")
-            except ValueError:
-                pass
-
-        # ADE residual / convergence
-        m4 = re.search(
-            r"[Aa][Dd][Ee].*(?:[Rr]esidual|[Cc]onverg)\s*[:=]\s*([0-9.eE+-]+)",
-            line)
-        if m4:
-            try:
-                val = float(m4.group(1))
-                self._ade_residual_history.append(val)
-                self._ade_residual_label.setText(f"{val:.4e}")
-            except ValueError:
-                pass
+            # ADE residual / convergence
+            m4 = _search_ade_residual(line)
+            if m4:
+                try:
+                    val = float(m4.group(1))
+                    self._ade_residual_history.append(val)
+                    self._ade_residual_label.setText(f"{val:.4e}")
+                except ValueError:
+                    pass
 
         # Phase detection
-        if "phase 1" in line.lower() or "navier-stokes" in line.lower():
+        lower = line.lower()
+        if "phase 1" in lower or "navier-stokes" in lower:
             self._phase_label.setText("NS Flow Solver (Phase 1)")
             self._status.setText("Running - NS Phase 1")
-        elif "phase 2" in line.lower():
+        elif "phase 2" in lower:
             self._phase_label.setText("NS Flow Solver (Phase 2)")
             self._status.setText("Running - NS Phase 2")
-        elif "ade" in line.lower() and ("start" in line.lower() or "transport" in line.lower()):
+        elif "ade" in lower and ("start" in lower or "transport" in lower):
             self._phase_label.setText("ADE Transport Solver")
             self._status.setText("Running - Transport")
-        elif "equilibrium" in line.lower():
+        elif "equilibrium" in lower:
             self._phase_label.setText("Equilibrium Solver")
             self._status.setText("Running - Equilibrium")
-        elif "kinetics" in line.lower():
+        elif "kinetics" in lower:
             self._phase_label.setText("Kinetics")
-        elif "biomass" in line.lower() and ("spread" in line.lower() or "push" in line.lower()):
+        elif "biomass" in lower and ("spread" in lower or "push" in lower):
             self._phase_label.setText("Biomass Redistribution")
 
     def on_finished(self, return_code: int, message: str):
@@ -681,3 +699,19 @@ def _escape_html(text: str) -> str:
             .replace("<", "&lt;")
             .replace(">", "&gt;")
             .replace('"', "&quot;"))
+
+
+def _output_color(line: str) -> str:
+    """Color for a simulation output line based on its content."""
+    line_lower = line.lower()
+    if "error" in line_lower or "fail" in line_lower:
+        return "#f44336"
+    if "warning" in line_lower:
+        return "#ffc107"
+    if "converge" in line_lower or "complete" in line_lower:
+        return "#5ca060"
+    if line.startswith("---") or line.startswith("==="):
+        return "#569cd6"
+    if "iT =" in line or "iT=" in line:
+        return "#9cdcfe"
+    return "#cccccc"
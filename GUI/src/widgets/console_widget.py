@@ -6,7 +6,7 @@ from PySide6.QtWidgets import (
     QLabel, QProgressBar, QFileDialog, QLineEdit,
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QTextCursor, QColor, QTextDocument
+from PySide6.QtGui import QTextCursor, QColor, QTextDocument, QTextCharFormat
 
 
 class ConsoleWidget(QWidget):
@@ -91,6 +91,8 @@ class ConsoleWidget(QWidget):
         self._text = QTextEdit()
         self._text.setReadOnly(True)
         self._text.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        # The document drops its oldest lines itself past this count
+        self._text.document().setMaximumBlockCount(self._max_lines)
         layout.addWidget(self._text)
 
     def append(self, text: str, color: str = None):
@@ -99,13 +101,9 @@ class ConsoleWidget(QWidget):
             html = f'<span style="color:{color}">{_escape(text)}</span>'
         else:
             # Auto-color based on content
-            lower = text.lower()
-            if "error" in lower or "fail" in lower or "terminat" in lower:
-                html = f'<span style="color:#c75050">{_escape(text)}</span>'
-            elif "warning" in lower or "warn" in lower:
-                html = f'<span style="color:#c0a040">{_escape(text)}</span>'
-            elif text.startswith("--") or text.startswith("=="):
-                html = f'<span style="color:#6a9ec7">{_escape(text)}</span>'
+            color = _auto_color(text)
+            if color:
+                html = f'<span style="color:{color}">{_escape(text)}</span>'
             else:
                 html = _escape(text)
 
@@ -114,16 +112,26 @@ class ConsoleWidget(QWidget):
         self._text.setTextCursor(cursor)
         self._text.append(html)
 
-        # Trim old lines
+    def append_lines(self, lines: list):
+        """Append a batch of auto-colored lines as one document edit."""
+        if not lines:
+            return
         doc = self._text.document()
-        if doc.blockCount() > self._max_lines:
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            cursor.movePosition(
-                QTextCursor.MoveOperation.Down,
-                QTextCursor.MoveMode.KeepAnchor,
-                doc.blockCount() - self._max_lines
-            )
-            cursor.removeSelectedText()
+        cursor = self._text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        new_block = not doc.isEmpty()
+        cursor.beginEditBlock()
+        for text in lines:
+            if new_block:
+                cursor.insertBlock()
+            new_block = True
+            fmt = QTextCharFormat()
+            color = _auto_color(text)
+            if color:
+                fmt.setForeground(QColor(color))
+            cursor.insertText(text, fmt)
+        cursor.endEditBlock()
+        self._text.setTextCursor(cursor)
 
     def log_info(self, text: str):
         ts = datetime.datetime.now().strftime("%H:%M:%S")
@@ -179,6 +187,7 @@ class ConsoleWidget(QWidget):
 
     def set_max_lines(self, n: int):
         self._max_lines = n
+        self._text.document().setMaximumBlockCount(n)
 
     # ── Search ──────────────────────────────────────────────────────
 
@@ -237,3 +246,15 @@ def _escape(text: str) -> str:
             .replace("&", "&amp;")
             .replace("<", "&lt;")
             .replace(">", "&gt;"))
+
+
+def _auto_color(text: str):
+    """Console color for a line based on its content, or None for plain."""
+    lower = text.lower()
+    if "error" in lower or "fail" in lower or "terminat" in lower:
+        return "#c75050"
+    if "warning" in lower or "warn" in lower:
+        return "#c0a040"
+    if text.startswith("--") or text.startswith("=="):
+        return "#6a9ec7"
+    return None
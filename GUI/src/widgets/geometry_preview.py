@@ -41,6 +41,9 @@ class GeometryPreviewWidget(QWidget):
         super().__init__(parent)
         self._data = None  # 3D numpy array (nx, ny, nz)
         self._nx = self._ny = self._nz = 0
+        # Last file read: (path, mtime_ns, size, binary) -> flat values
+        self._flat_key = None
+        self._flat = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -111,13 +114,7 @@ class GeometryPreviewWidget(QWidget):
         """Load a .dat geometry file and display the middle slice."""
         try:
             expected = nx * ny * nz
-            file_size = os.path.getsize(filepath)
-            if file_size == expected:
-                # Binary format: 1 byte per voxel
-                flat = np.fromfile(filepath, dtype=np.uint8)
-            else:
-                # Text format: one digit per line
-                flat = np.loadtxt(filepath, dtype=int).flatten()
+            flat = self._read_flat(filepath, expected)
             if flat.size != expected:
                 self._info_lbl.setText(
                     f"Size mismatch: file has {flat.size} values, "
@@ -142,6 +139,26 @@ class GeometryPreviewWidget(QWidget):
         except Exception as e:
             self._info_lbl.setText(f"Failed to load: {e}")
 
+    def _read_flat(self, filepath: str, expected: int) -> np.ndarray:
+        """Flat voxel values of *filepath*, re-read only if the file changed.
+
+        Every nx/ny/nz edit in the domain panel reloads the preview; only
+        the reshape depends on the dimensions, so the parsed values are
+        kept while path, mtime and size stay the same.
+        """
+        st = os.stat(filepath)
+        binary = st.st_size == expected
+        key = (filepath, st.st_mtime_ns, st.st_size, binary)
+        if key != self._flat_key:
+            if binary:
+                # Binary format: 1 byte per voxel
+                flat = np.fromfile(filepath, dtype=np.uint8)
+            else:
+                # Text format: one digit per line
+                flat = np.loadtxt(filepath, dtype=int).flatten()
+            self._flat_key, self._flat = key, flat
+        return self._flat
+
     def _on_plane_changed(self, idx):
         """Update slider range when plane changes."""
         if self._data is None:
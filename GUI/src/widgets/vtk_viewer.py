@@ -10,6 +10,7 @@ Supports:
   - Remove loaded geometry (button + menu + keyboard shortcut)
 """
 
+import re
 import struct
 from pathlib import Path
 
@@ -27,6 +28,7 @@ from PySide6.QtGui import QAction, QKeySequence
 try:
     import vtk
     from vtkmodules.qt.QVTKRenderWindowInteractor import QVTKRenderWindowInteractor
+    from vtkmodules.util.numpy_support import numpy_to_vtk
     HAS_VTK = True
 except ImportError:
     HAS_VTK = False
@@ -401,13 +403,14 @@ class VTKViewer(QWidget):
             n_cells = nx * ny * nz
 
             # Try text first (most common from geometry generator)
-            values = None
-            try:
-                with open(filepath, "r") as f:
-                    values = [int(x) for line in f for x in line.split()
-                              if x.strip()]
-            except (ValueError, UnicodeDecodeError):
-                values = None
+            values = _read_digit_text(filepath)
+            if values is None:
+                try:
+                    with open(filepath, "r") as f:
+                        values = [int(x) for line in f for x in line.split()
+                                  if x.strip()]
+                except (ValueError, UnicodeDecodeError):
+                    values = None
 
             if values is None or len(values) < n_cells:
                 # Fall back to binary int32
@@ -432,11 +435,8 @@ class VTKViewer(QWidget):
             img = vtk.vtkImageData()
             img.SetDimensions(nx, ny, nz)
             img.SetSpacing(1.0, 1.0, 1.0)
-            arr = vtk.vtkIntArray()
+            arr = numpy_to_vtk(vtk_flat, deep=True)  # int32 -> vtkIntArray
             arr.SetName("MaterialNumber")
-            arr.SetNumberOfTuples(n_cells)
-            for i in range(n_cells):
-                arr.SetValue(i, int(vtk_flat[i]))
             img.GetPointData().SetScalars(arr)
             self._display_dataset(img, filepath)
         except Exception:
@@ -1037,3 +1037,26 @@ class VTKViewer(QWidget):
         if hasattr(self, '_array_combo'):
             self._array_combo.clear()
         self._vtk_widget.GetRenderWindow().Render()
+
+
+# Ten digits in a row may not fit in int32
+_LONG_NUMBER_RE = re.compile(rb"[0-9]{10}")
+
+
+def _read_digit_text(filepath: str):
+    """Integers of a digits-and-whitespace text file, parsed in C.
+
+    Geometry from the generator and the solver is always of this form.
+    Returns None for any other content (or numbers too long for int32),
+    so the caller can fall back to its per-token int() parse.
+    """
+    with open(filepath, "rb") as f:
+        data = f.read()
+    if data.translate(None, b"0123456789 \t\r\n"):
+        return None
+    if _LONG_NUMBER_RE.search(data):
+        return None
+    if not data or data.isspace():
+        # np.fromstring would read blank text as a single 0
+        return np.empty(0, dtype=np.int32)
+    return np.fromstring(data.decode("ascii"), dtype=np.int32, sep=" ")
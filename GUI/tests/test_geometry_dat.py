@@ -0,0 +1,169 @@
+"""Tests for the fast .dat geometry readers.
+
+Checks the numpy text parser used by the 3D viewer on the file shapes
+the geometry generator and hand-written inputs produce.
+"""
+import pytest
+import sys
+import os
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture
+def vtk_viewer(qapp):
+    # The widget module builds icons at import, which needs a QApplication
+    from src.widgets import vtk_viewer
+    return vtk_viewer
+
+
+class TestReadDigitText:
+    """vtk_viewer._read_digit_text on geometry text files."""
+
+    def _read(self, vtk_viewer, tmp_path, data: bytes):
+        path = tmp_path / "geometry.dat"
+        path.write_bytes(data)
+        return vtk_viewer._read_digit_text(str(path))
+
+    def test_one_value_per_line(self, vtk_viewer, tmp_path):
+        vals = self._read(vtk_viewer, tmp_path, b"0\n1\n2\n")
+        assert vals.tolist() == [0, 1, 2]
+
+    def test_crlf(self, vtk_viewer, tmp_path):
+        vals = self._read(vtk_viewer, tmp_path, b"0\r\n1\r\n2\r\n")
+        assert vals.tolist() == [0, 1, 2]
+
+    def test_multi_column(self, vtk_viewer, tmp_path):
+        vals = self._read(vtk_viewer, tmp_path, b"0 1 2\n3\t4 5\n6")
+        assert vals.tolist() == [0, 1, 2, 3, 4, 5, 6]
+
+    @pytest.mark.parametrize("data", [b"", b"   ", b"\n\n", b" \r\n\t"])
+    def test_empty_or_blank(self, vtk_viewer, tmp_path, data):
+        """Blank files hold no voxels, not a single 0."""
+        vals = self._read(vtk_viewer, tmp_path, data)
+        assert vals is not None
+        assert len(vals) == 0
+
+    def test_non_digit_falls_back(self, vtk_viewer, tmp_path):
+        assert self._read(vtk_viewer, tmp_path, b"0 1 -2\n") is None
+        assert self._read(vtk_viewer, tmp_path, b"0 1.5\n") is None
+
+    def test_int32_overflow_falls_back(self, vtk_viewer, tmp_path):
+        """Numbers too long for int32 are not silently wrapped."""
+        assert self._read(vtk_viewer, tmp_path, b"1 99999999999\n") is None
+
+    def test_matches_python_parse(self, vtk_viewer, tmp_path):
+        rng = np.random.default_rng(0)
+        values = rng.integers(0, 999999999, size=500)
+        text = "\n".join(" ".join(map(str, row))
+                         for row in values.reshape(50, 10))
+        vals = self._read(vtk_viewer, tmp_path, text.encode())
+        assert vals.tolist() == [int(x) for x in text.split()]
+
+
+@pytest.fixture
+def domain_panel(qapp):
+    from src.panels.domain_panel import DomainPanel
+    return DomainPanel
+
+
+class TestDigitTokensPerLine:
+    """DomainPanel._digit_tokens_per_line token histogram."""
+
+    def _hist(self, domain_panel, tmp_path, data: bytes, **kw):
+        path = tmp_path / "geometry.dat"
+        path.write_bytes(data)
+        return domain_panel._digit_tokens_per_line(str(path), **kw)
+
+    def test_one_value_per_line(self, domain_panel, tmp_path):
+        assert self._hist(domain_panel, tmp_path, b"0\n1\n2\n") == {1: 3}
+
+    def test_crlf(self, domain_panel, tmp_path):
+        data = b"0 1 2\r\n3 4 5\r\n6 7\r\n"
+        assert self._hist(domain_panel, tmp_path, data) == {3: 2, 2: 1}
+
+    def test_bare_cr(self, domain_panel, tmp_path):
+        data = b"0 1 2\r3 4 5\r6 7\r"
+        assert self._hist(domain_panel, tmp_path, data) == {3: 2, 2: 1}
+
+    def test_multi_column_and_blank_lines(self, domain_panel, tmp_path):
+        data = b"0 1 2 3\n\n  4\t5 6  7\n\t\n8 9 10 11\n"
+        assert self._hist(domain_panel, tmp_path, data) == {4: 3}
+
+    def test_no_trailing_newline(self, domain_panel, tmp_path):
+        assert self._hist(domain_panel, tmp_path, b"0 1\n2 3") == {2: 2}
+        assert self._hist(domain_panel, tmp_path, b"0\n1\n22") == {1: 3}
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64])
+    def test_lines_split_across_chunks(self, domain_panel, tmp_path,
+                                       chunk_size):
+        data = b"10 11 12\r\n13 14 15\n16 17\r18 19 20\n21"
+        hist = self._hist(domain_panel, tmp_path, data,
+                          chunk_size=chunk_size)
+        assert hist == {3: 3, 2: 1, 1: 1}
+
+    def test_multi_column_many_chunks(self, domain_panel, tmp_path):
+        """Multi-column files larger than one chunk count every line."""
+        line = b" ".join(b"%d" % (i % 7) for i in range(30)) + b"\n"
+        data = line * 2000 + b"1 2\r\n" * 10
+        for chunk_size in (4096, 1 << 21):
+            hist = self._hist(domain_panel, tmp_path, data,
+                              chunk_size=chunk_size)
+            assert hist == {30: 2000, 2: 10}
+
+    def test_empty_file(self, domain_panel, tmp_path):
+        assert self._hist(domain_panel, tmp_path, b"") == {}
+
+    @pytest.mark.parametrize("data", [
+        b"0 1 2\n3 -4 5\n", b"0 1.5\n", b"0 x 1\n", b"\xef\xbb\xbf0 1\n",
+    ])
+    def test_non_digit_returns_none(self, domain_panel, tmp_path, data):
+        """Anything but digits and whitespace is left to the text scanner."""
+        assert self._hist(domain_panel, tmp_path, data) is None
+        assert self._hist(domain_panel, tmp_path, data, chunk_size=2) is None
+
+
+class TestScanTextTokens:
+    """DomainPanel._scan_text_tokens, the fallback for non-digit files."""
+
+    def _scan(self, domain_panel, tmp_path, data: bytes):
+        path = tmp_path / "geometry.dat"
+        path.write_bytes(data)
+        hist = {}
+        total = domain_panel._scan_text_tokens(str(path), hist)
+        return total, hist
+
+    def test_signed_values(self, domain_panel, tmp_path):
+        total, hist = self._scan(domain_panel, tmp_path,
+                                 b"0 -1 2\n+3 4 5\n")
+        assert total == 6
+        assert hist == {3: 2}
+
+    def test_invalid_tokens_skipped(self, domain_panel, tmp_path):
+        total, hist = self._scan(domain_panel, tmp_path,
+                                 b"0 1.5 x 2\n# comment\n3 4\n")
+        assert total == 4
+        assert hist == {2: 2}
+
+    def test_unreadable_returns_none(self, domain_panel, tmp_path):
+        total, _ = self._scan(domain_panel, tmp_path, b"0 1\n\xff\xfe\x00\n")
+        assert total is None
+
+    @pytest.mark.parametrize("data", [
+        b"0\n1\n2\n",
+        b"0 1 2\r\n3 4 5\r\n6 7\r\n",
+        b"0 1 2\r3 4 5\r6 7\r",
+        b"0 1 2 3\n\n  4\t5 6  7\n\t\n8 9 10 11",
+        b"",
+        b" \n\n",
+    ])
+    def test_matches_numpy_path(self, domain_panel, tmp_path, data):
+        """Both counters agree on files the numpy path accepts."""
+        total, hist = self._scan(domain_panel, tmp_path, data)
+        for chunk_size in (3, 1 << 21):
+            fast = domain_panel._digit_tokens_per_line(
+                str(tmp_path / "geometry.dat"), chunk_size=chunk_size)
+            assert fast == hist
+            assert sum(n * c for n, c in fast.items()) == total
@@ -132,6 +132,9 @@ class SignalCollector:
     def on_line(self, text: str):
         self.lines.append(text)
 
+    def on_lines(self, batch: list):
+        self.lines.extend(batch)
+
     def on_progress(self, cur: int, mx: int):
         self.progress_events.append((cur, mx))
 
@@ -143,6 +146,7 @@ class SignalCollector:
 
     def connect(self, runner: SimulationRunner):
         runner.output_line.connect(self.on_line)
+        runner.output_lines.connect(self.on_lines)
         runner.progress.connect(self.on_progress)
         runner.finished_signal.connect(self.on_finished)
         runner.diagnostic_report.connect(self.on_diagnostic)
@@ -0,0 +1,93 @@
+"""Tests for the run panel's solver-output parsers.
+
+The residual patterns are anchored rewrites of the original unanchored
+searches; these pin them to the same captures on representative lines.
+"""
+import pytest
+import re
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+# The patterns as first written, run with re.search
+_OLD_NS = re.compile(r"[Nn][Ss].*[Rr]esidual\s*[:=]\s*([0-9.eE+-]+)")
+_OLD_ADE = re.compile(
+    r"[Aa][Dd][Ee].*(?:[Rr]esidual|[Cc]onverg)\s*[:=]\s*([0-9.eE+-]+)")
+
+LINES = [
+    # NS
+    "[NS] iT = 100  residual = 1.23e-05",
+    "  NS Residual: 4.5E-7",
+    "ns residual=0.001",
+    "nS solver converged, Residual : 1e-9",
+    "Phase 1 NS flow: residual=2.0e-3, residual=3.0e-3",
+    # ADE
+    "[ADE] iT = 200  residual = 6.7e-08",
+    "ADE convergence = 1e-10",
+    "ade Converged: 5e-4",
+    "aDe step, residual: +1.5e+2",
+    "  ADE residual 1e-3",  # no separator
+    # Both prefixes, either order
+    "[NS] residual=1e-5 [ADE] residual=2e-6",
+    "[ADE] residual=2e-6 [NS] residual=1e-5",
+    "transport: NS residual = 3e-4, ADE convergence = 7e-9",
+    "Transport instance: residual: 9e-9",
+    "nsnsnsns residual = 1",
+    "adeade adE converge=4.0",
+    # Non-matching
+    "",
+    "ITERATION 1200 | Time: 3.4s",
+    "Residual = 1e-5",
+    "NS residual = abc",
+    "ADE residual:",
+    "converge = 1e-3 before ADE",
+    "N S residual = 1e-4",
+    "A DE convergence = 1e-4",
+    "Transport finished",
+    "│ SIMULATION: max_iter=5000, nsteps=10",
+]
+
+
+@pytest.fixture
+def run_panel(qapp):
+    from src.panels import run_panel
+    return run_panel
+
+
+def _groups(m):
+    return None if m is None else m.group(1)
+
+
+@pytest.mark.parametrize("line", LINES)
+def test_ns_residual_matches_old_pattern(run_panel, line):
+    assert (_groups(run_panel._search_ns_residual(line))
+            == _groups(_OLD_NS.search(line)))
+
+
+@pytest.mark.parametrize("line", LINES)
+def test_ade_residual_matches_old_pattern(run_panel, line):
+    assert (_groups(run_panel._search_ade_residual(line))
+            == _groups(_OLD_ADE.search(line)))
+
+
+@pytest.mark.parametrize("line", LINES)
+def test_substring_gate_keeps_every_match(line):
+    """_parse_output_line only runs the residual patterns past this gate."""
+    if _OLD_NS.search(line) or _OLD_ADE.search(line):
+        assert "esidual" in line or "onverg" in line
+
+
+@pytest.mark.parametrize("tail", [
+    "NS residual = 1e-4",
+    "ADE residual: 2e-5",
+    "NS residual = 1e-4 ADE residual: 2e-5",
+    "no residual here",
+])
+def test_long_lines_match_old_pattern(run_panel, tail):
+    """Lines full of "ns" (from "transport") still capture the same value."""
+    line = "transport " * 2000 + tail
+    assert (_groups(run_panel._search_ns_residual(line))
+            == _groups(_OLD_NS.search(line)))
+    assert (_groups(run_panel._search_ade_residual(line))
+            == _groups(_OLD_ADE.search(line)))
@@ -111,6 +111,9 @@ class SignalCollector:
     def on_line(self, text: str):
         self.lines.append(text)
 
+    def on_lines(self, batch: list):
+        self.lines.extend(batch)
+
     def on_progress(self, cur: int, mx: int):
         self.progress_events.append((cur, mx))
 
@@ -122,6 +125,7 @@ class SignalCollector:
 
     def connect(self, runner: SimulationRunner):
         runner.output_line.connect(self.on_line)
+        runner.output_lines.connect(self.on_lines)
         runner.progress.connect(self.on_progress)
         runner.finished_signal.connect(self.on_finished)
         runner.diagnostic_report.connect(self.on_diagnostic)
@@ -218,6 +222,25 @@ sys.stdout.flush()
         rc, _ = collector.finished[0]
         assert rc == 0
 
+    def test_mixed_line_endings(self, qtbot, work_dir):
+        """\\n, \\r\\n and bare \\r all end a line, as in text mode."""
+        script = """\
+import sys
+sys.stdout.buffer.write(b"unix\\nwindows\\r\\nold mac\\rtail")
+sys.stdout.flush()
+"""
+        exe = _write_fake_solver(work_dir, script)
+        collector = SignalCollector()
+
+        runner = SimulationRunner(exe, str(work_dir))
+        collector.connect(runner)
+
+        with qtbot.waitSignal(runner.finished_signal, timeout=10_000):
+            runner.start()
+
+        for expected in ("unix", "windows", "old mac", "tail"):
+            assert expected in collector.lines
+
 
 # ===================================================================
 # TEST 3 – QThread/QObject garbage collection
@@ -378,6 +401,51 @@ for i in range(1, 10000):
             "Process survived both SIGTERM and SIGKILL!"
         )
 
+    @pytest.mark.skipif(os.name == "nt",
+                        reason="pipes cannot be polled on Windows")
+    def test_cancel_with_pipe_held_open(self, qtbot, work_dir):
+        """A detached grandchild keeps stdout open after the kill; cancel
+        must still finish without waiting for the pipe to close."""
+        script = """\
+import subprocess, time
+holder = subprocess.Popen(
+    [sys.executable, "-c", "import time; time.sleep(30)"],
+    start_new_session=True)
+print(f"holder pid {holder.pid}")
+print("ade_max_iT = 9999")
+for i in range(1, 10000):
+    time.sleep(0.05)
+    print(f"iT = {i}")
+    sys.stdout.flush()
+"""
+        exe = _write_fake_solver(work_dir, script)
+        collector = SignalCollector()
+
+        runner = SimulationRunner(exe, str(work_dir))
+        collector.connect(runner)
+
+        runner.start()
+        qtbot.waitUntil(
+            lambda: len(collector.progress_events) >= 2,
+            timeout=10_000,
+        )
+        holder_pid = int(next(
+            l.split()[-1] for l in collector.lines
+            if l.startswith("holder pid")))
+
+        try:
+            runner.cancel()
+            qtbot.waitUntil(
+                lambda: len(collector.finished) >= 1,
+                timeout=5_000,
+            )
+            assert "cancelled" in collector.finished[0][1].lower()
+        finally:
+            try:
+                os.kill(holder_pid, 9)
+            except ProcessLookupError:
+                pass
+
 
 # ===================================================================
 # TEST 5 – Working directory / environment
@@ -608,6 +676,45 @@ for i in [1, 10, 50, 100]:
         maxes = [mx for _, mx in collector.progress_events]
         assert 100 in maxes
 
+    def test_solver_banner_parsing(self, qtbot, work_dir):
+        """The C++ solver's own banner/iteration lines drive progress."""
+        script = """\
+print("| SIMULATION: max_iter=500, VTI=100, CHK=1000")
+for i in [0, 100, 200]:
+    print(f"| ITERATION {i}  |  Time: 1.0e+00 s")
+    sys.stdout.flush()
+"""
+        exe = _write_fake_solver(work_dir, script)
+        collector = SignalCollector()
+
+        runner = SimulationRunner(exe, str(work_dir))
+        collector.connect(runner)
+
+        with qtbot.waitSignal(runner.finished_signal, timeout=10_000):
+            runner.start()
+
+        assert collector.progress_events == [(0, 500), (100, 500), (200, 500)]
+
+    def test_repeated_iteration_emitted_once(self, qtbot, work_dir):
+        """Several lines for the same iteration give one progress event."""
+        script = """\
+print("ade_max_iT = 20")
+for i in [10, 20]:
+    print(f"iT = {i}  [NS] residual = 1e-3")
+    print(f"iT = {i}  [ADE] residual = 1e-4")
+    sys.stdout.flush()
+"""
+        exe = _write_fake_solver(work_dir, script)
+        collector = SignalCollector()
+
+        runner = SimulationRunner(exe, str(work_dir))
+        collector.connect(runner)
+
+        with qtbot.waitSignal(runner.finished_signal, timeout=10_000):
+            runner.start()
+
+        assert collector.progress_events == [(10, 20), (20, 20)]
+
 
 # ===================================================================
 # TEST 10 – Long-running process with slow output
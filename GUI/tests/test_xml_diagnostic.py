@@ -0,0 +1,77 @@
+"""Tests for the crash diagnostic report (xml_diagnostic.diagnose_crash)."""
+import pytest
+import sys
+import os
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.project_manager import ProjectManager
+from src.core.templates import create_from_template
+from src.core.xml_diagnostic import diagnose_crash
+
+
+def _write_xml(directory, edit=None):
+    """Export a biofilm project with known faults, then apply *edit*."""
+    p = create_from_template("biotic_sessile")
+    p.fluid.tau = 0.5                                    # unstable LBM
+    p.microbiology.microbes[0].initial_densities = "99.0"  # vs "3 6"
+    p.domain.geometry_filename = "diagnostic_test_geometry.dat"  # absent
+    directory.mkdir()
+    xml_path = directory / "CompLaB.xml"
+    ProjectManager.export_xml(p, str(xml_path))
+    if edit is not None:
+        tree = ET.parse(xml_path)
+        edit(tree.getroot())
+        tree.write(xml_path)
+    return str(xml_path)
+
+
+def _findings(report, directory):
+    """Report lines without the timestamp and the file location."""
+    return [line.replace(str(directory), "<dir>")
+            for line in report.splitlines() if "Generated:" not in line]
+
+
+class TestExitCodes:
+
+    @pytest.mark.parametrize("signed, unsigned, name", [
+        (-1073741819, 3221225477, "Access Violation (0xC0000005)"),
+        (-1073740940, 3221226356, "Heap Corruption (0xC0000374)"),
+    ])
+    def test_unsigned_windows_exit_code(self, tmp_path, signed, unsigned,
+                                        name):
+        """Windows reports NTSTATUS codes unsigned; both forms are named."""
+        xml_path = _write_xml(tmp_path / "run")
+        for code in (signed, unsigned):
+            report = diagnose_crash(xml_path, code)
+            assert f"Error type: {name}" in report
+            assert f"Exit code : {code}" in report
+
+    def test_unknown_exit_code(self, tmp_path):
+        report = diagnose_crash(_write_xml(tmp_path / "run"), 12345)
+        assert "Unknown Error (code 12345)" in report
+
+
+class TestSectionLookup:
+
+    def test_misplaced_sections_same_findings(self, tmp_path):
+        """Sections outside their usual parent are still diagnosed."""
+        def misplace(root):
+            lb = root.find("LB_numerics")
+            domain = lb.find("domain")
+            tau = lb.find("tau")
+            # <domain> at top level with <tau> inside it
+            lb.remove(domain)
+            lb.remove(tau)
+            domain.append(tau)
+            root.insert(0, domain)
+
+        canonical = diagnose_crash(_write_xml(tmp_path / "a"), 1)
+        misplaced = diagnose_crash(_write_xml(tmp_path / "b", misplace), 1)
+
+        assert "Domain: nx=30, ny=15, nz=15" in misplaced
+        assert "tau=0.5 is <= 0.5" in misplaced
+        assert "material_number has 2 value(s)" in misplaced
+        assert (_findings(misplaced, tmp_path / "b")
+                == _findings(canonical, tmp_path / "a"))
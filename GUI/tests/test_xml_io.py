@@ -59,6 +59,18 @@ class TestXMLExportStructure:
         assert sm.find("biotic_mode").text == "false"
         assert sm.find("enable_abiotic_kinetics").text == "true"
 
+    def test_failed_export_keeps_existing_file(self, tmp_path):
+        """The file is only replaced once the whole document is built."""
+        xml_path = tmp_path / "CompLaB.xml"
+        ProjectManager.export_xml(create_from_template("flow_only"), str(xml_path))
+        before = xml_path.read_bytes()
+        broken = create_from_template("flow_only")
+        broken.domain.dx = "not a number"
+        with pytest.raises(Exception):
+            ProjectManager.export_xml(broken, str(xml_path))
+
+        assert xml_path.read_bytes() == before
+
 
 class TestXMLRoundTrip:
     """Export then import - data must survive the round trip."""
@@ -91,6 +103,96 @@ class TestXMLRoundTrip:
         assert loaded.simulation_mode.biotic_mode == original.simulation_mode.biotic_mode
         assert loaded.simulation_mode.enable_kinetics == original.simulation_mode.enable_kinetics
 
+    def test_import_independent_of_section_order(self, tmp_path):
+        """Sections are read while streaming; reordering them must not matter."""
+        original = create_from_template("coupled_biotic_abiotic")
+        original.equilibrium.enabled = True
+        original.equilibrium.component_names = ["A"]
+        original.equilibrium.stoichiometry = [[1.0]] * len(original.substrates)
+        original.equilibrium.log_k = [0.5] * len(original.substrates)
+        xml_path = str(tmp_path / "CompLaB.xml")
+        ProjectManager.export_xml(original, xml_path)
+        in_order = ProjectManager.import_xml(xml_path)
+
+        tree = ET.parse(xml_path)
+        root = tree.getroot()
+        sections = list(root)
+        for el in sections:
+            root.remove(el)
+        root.extend(reversed(sections))
+        tree.write(xml_path)
+        reordered = ProjectManager.import_xml(xml_path)
+
+        assert reordered == in_order
+        assert reordered.equilibrium.log_k == original.equilibrium.log_k
+        assert any(m.material_number for m in reordered.microbiology.microbes)
+
+    def test_import_duplicate_sections(self, tmp_path):
+        """Only the first copy of a repeated top-level section is read."""
+        import copy
+        original = create_from_template("abiotic_equilibrium")
+        xml_path = str(tmp_path / "CompLaB.xml")
+        ProjectManager.export_xml(original, xml_path)
+        expected = ProjectManager.import_xml(xml_path)
+
+        tree = ET.parse(xml_path)
+        root = tree.getroot()
+        for tag in ("chemistry", "microbiology", "equilibrium"):
+            dup = copy.deepcopy(root.find(tag))
+            for el in dup.iter("name_of_substrates"):
+                el.text = "Dup"
+            if tag == "equilibrium":
+                dup.find("components").text = "X Y"
+            root.append(dup)
+        tree.write(xml_path)
+        loaded = ProjectManager.import_xml(xml_path)
+
+        assert loaded == expected
+        assert "Dup" not in [s.name for s in loaded.substrates]
+
+    def _write_xxe(self, tmp_path):
+        secret = tmp_path / "secret.txt"
+        secret.write_text("SECRET")
+        xml_path = tmp_path / "CompLaB.xml"
+        ProjectManager.export_xml(create_from_template("abiotic_reaction"),
+                                  str(xml_path))
+        text = xml_path.read_text().replace(
+            "<parameters>",
+            f'<!DOCTYPE parameters [<!ENTITY xxe SYSTEM '
+            f'"{secret.as_uri()}">]>\n<parameters>', 1)
+        text = text.replace("<name_of_substrates>Reactant",
+                            "<name_of_substrates>Reactant&xxe;", 1)
+        xml_path.write_text(text)
+        return str(xml_path)
+
+    def test_import_external_entity_not_expanded(self, tmp_path):
+        """External entities (XXE) must never pull in file contents."""
+        pytest.importorskip("lxml")
+        loaded = ProjectManager.import_xml(self._write_xxe(tmp_path))
+
+        names = [s.name for s in loaded.substrates]
+        assert names[0] == "Reactant"
+        assert not any("SECRET" in n for n in names)
+
+    def test_import_external_entity_stdlib(self, tmp_path, monkeypatch):
+        """expat refuses the external entity instead of expanding it."""
+        from src.core import project_manager
+        monkeypatch.setattr(project_manager, "HAS_LXML", False)
+        with pytest.raises(ET.ParseError):
+            ProjectManager.import_xml(self._write_xxe(tmp_path))
+
+    def test_import_stdlib_fallback(self, tmp_path, monkeypatch):
+        """Without lxml the stdlib parser must produce the same project."""
+        from src.core import project_manager
+        original = create_from_template("coupled_biotic_abiotic")
+        xml_path = str(tmp_path / "CompLaB.xml")
+        ProjectManager.export_xml(original, xml_path)
+        default = ProjectManager.import_xml(xml_path)
+        monkeypatch.setattr(project_manager, "HAS_LXML", False)
+        fallback = ProjectManager.import_xml(xml_path)
+
+        assert fallback == default
+
 
 class TestJSONRoundTrip:
     """Save/load .complab (JSON) format."""
@@ -110,6 +212,99 @@ class TestJSONRoundTrip:
         assert len(loaded.microbiology.microbes) == len(original.microbiology.microbes)
         assert loaded.template_key == original.template_key
 
+    def test_json_round_trip_stdlib_fallback(self, tmp_path, monkeypatch):
+        """Without orjson the stdlib json path must produce the same project."""
+        from src.core import project_manager
+        monkeypatch.setattr(project_manager, "HAS_ORJSON", False)
+        original = create_from_template("coupled_biotic_abiotic")
+        json_path = str(tmp_path / "test.complab")
+        ProjectManager.save_project(original, json_path)
+        loaded = ProjectManager.load_project(json_path)
+
+        assert loaded == original
+        # Same untagged layout as the orjson writer and older versions
+        with open(json_path) as f:
+            assert '"_type"' not in f.read()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_round_trip_non_finite(self, tmp_path, monkeypatch,
+                                        use_orjson):
+        """NaN/inf must survive save/load on both writers, not turn into null."""
+        import math
+        from src.core import project_manager
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(project_manager, "HAS_ORJSON", use_orjson)
+        original = create_from_template("abiotic_equilibrium")
+        original.fluid.delta_P = float("inf")
+        original.substrates[0].initial_concentration = float("-inf")
+        original.equilibrium.log_k[1] = float("nan")
+        json_path = str(tmp_path / "test.complab")
+        ProjectManager.save_project(original, json_path)
+        loaded = ProjectManager.load_project(json_path)
+
+        assert loaded.fluid.delta_P == float("inf")
+        assert loaded.substrates[0].initial_concentration == float("-inf")
+        assert math.isnan(loaded.equilibrium.log_k[1])
+        # And the reloaded project still exports
+        ProjectManager.export_xml(loaded, str(tmp_path / "CompLaB.xml"))
+
+    def test_json_round_trip_numpy_float(self, tmp_path):
+        """numpy.float64 values (rejected by orjson) still save and load."""
+        np = pytest.importorskip("numpy")
+        original = create_from_template("flow_only")
+        original.fluid.delta_P = np.float64(2.5e-3)
+        original.iteration.ade_max_iT = 2 ** 70
+        json_path = str(tmp_path / "test.complab")
+        ProjectManager.save_project(original, json_path)
+        loaded = ProjectManager.load_project(json_path)
+
+        assert loaded.fluid.delta_P == 2.5e-3
+        assert loaded.iteration.ade_max_iT == 2 ** 70
+
+    def test_failed_save_keeps_existing_file(self, tmp_path):
+        """A project that cannot be serialized must not truncate the file."""
+        json_path = tmp_path / "test.complab"
+        ProjectManager.save_project(create_from_template("flow_only"),
+                                    str(json_path))
+        before = json_path.read_bytes()
+        broken = create_from_template("flow_only")
+        broken.fluid.delta_P = object()
+        with pytest.raises(TypeError):
+            ProjectManager.save_project(broken, str(json_path))
+
+        assert json_path.read_bytes() == before
+
+    def test_load_legacy_file(self, tmp_path):
+        """.complab files written by dataclasses.asdict must still load."""
+        import json
+        from dataclasses import asdict
+        original = create_from_template("biotic_sessile")
+        json_path = tmp_path / "legacy.complab"
+        json_path.write_text(json.dumps(asdict(original), indent=2))
+        loaded = ProjectManager.load_project(str(json_path))
+
+        assert loaded == original
+
+    def test_export_non_bool_flags(self, tmp_path):
+        """0/1/null flags from hand-edited files export as false/true."""
+        import json
+        from dataclasses import asdict
+        data = asdict(create_from_template("abiotic_equilibrium"))
+        data["simulation_mode"]["biotic_mode"] = 1
+        data["simulation_mode"]["enable_kinetics"] = 0
+        data["fluid"]["track_performance"] = None
+        json_path = tmp_path / "edited.complab"
+        json_path.write_text(json.dumps(data))
+        loaded = ProjectManager.load_project(str(json_path))
+        xml_path = str(tmp_path / "CompLaB.xml")
+        ProjectManager.export_xml(loaded, xml_path)
+
+        root = ET.parse(xml_path).getroot()
+        assert root.find("simulation_mode/biotic_mode").text == "true"
+        assert root.find("simulation_mode/enable_kinetics").text == "false"
+        assert root.find("LB_numerics/track_performance").text == "false"
+
 
 class TestKineticsDeployment:
     """Test that kinetics .hh files are correctly deployed to disk."""